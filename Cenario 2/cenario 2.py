@@ -1,31 +1,60 @@
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só o motor 'vetorizado' depende dele.
+    np = None
+
 from uteis import GraphAdjMatrix
+from leitor_arestas import ler_arestas
+import johnson
+from rotas import CacheDeRotas, exportar_caminhos
+
+
+class CicloNegativoError(ValueError):
+    """Há um ciclo de custo negativo; 'ciclo' lista seus vértices (o primeiro repetido no final)."""
+
+    def __init__(self, ciclo):
+        super().__init__(f"O grafo contém um ciclo negativo: {' -> '.join(map(str, ciclo))}")
+        self.ciclo = ciclo
+
+
+def extrair_ciclo(inicio, sucessor, n):
+    """
+    Segue sucessor(v) a partir de 'inicio' até repetir um vértice e retorna
+    o ciclo encontrado, com o vértice inicial do ciclo repetido no final.
+    """
+    visitados = {}
+    atual = inicio
+    sequencia = []
+    while atual not in visitados and len(sequencia) <= n:
+        visitados[atual] = len(sequencia)
+        sequencia.append(atual)
+        atual = sucessor(atual)
+    return sequencia[visitados[atual]:] + [atual]
 
 
 class ReadFile:
 
     def __init__(self) -> None:
-        self.nos = None
+        self.arestas = None
 
     @property
     def openfile(self):
-        with open("Cenario 2/graph2.txt", "r") as file:
-            readfile = file.read()
-            linhas = readfile.split("\n")
-            # Retirando a primeira linha do arquivo e usando list  comprehension para mudar o tipo para int.
-            self.nos = [int(num) for linha in linhas for num in linha.split() if num.strip() != ""]
-
-        return self.nos
+        # Lê o cabeçalho 'n m' e os trechos 'v w peso' em lote, direto para arrays tipados
+        self.arestas = ler_arestas("Cenario 2/graph2.txt")
+        return self.arestas
 
 
 class BellmanFord(ReadFile, GraphAdjMatrix):
     # Iniciar o classe com a matriz de adjacência e a matriz de roteamento M
     def __init__(self) -> None:
         ReadFile.__init__(self)
-        self.nosfloyd = self.openfile
-        GraphAdjMatrix.__init__(self, n = self.nos[0], directed = True)
+        self.openfile
+        GraphAdjMatrix.__init__(self, n = self.arestas.n, directed = True)
         
         # Matriz de Distância
-        n = self.nos[0]
+        n = self.arestas.n
         self.dist = [[float('inf') for _ in range(n)] for _ in range(n)]
 
         # Diagonais igual a 0
@@ -34,29 +63,202 @@ class BellmanFord(ReadFile, GraphAdjMatrix):
 
 
         # Construído a matriz de Recorrência
-        for i in range(2, len(self.nos), 3):
+        for v, w, weight in self.arestas:
             # Construí os pesos iniciais D0
-            v = self.nos[i] 
-            w = self.nos[i+1] 
-            weight = self.nos[i+2]
-            
             self.addEdge(v,w)
             self.dist[v][w] = weight
 
-            
-    def CaminhoMinimo(self):
+        # Lista de saída de cada vértice, montada sob demanda para o Bellman-Ford
+        self._saidas = None
+        # Número de rodadas da última execução de bellman_ford
+        self.rodadas = 0
+        # Motor que já resolveu todos os pares em self.dist/self.M (None se nenhum)
+        self.todos_os_pares = None
+        # Caminhos já reconstruídos a partir de self.M
+        self.cache_rotas = CacheDeRotas()
+
+    def _lista_de_saida(self):
+        """Arestas de saída [(w, peso), ...] de cada vértice, a partir dos arrays de arestas."""
+        if self._saidas is None:
+            saidas = defaultdict(list)
+            for v, w, weight in self.arestas:
+                saidas[v].append((w, weight))
+            self._saidas = saidas
+        return self._saidas
+
+    def bellman_ford(self, origem):
+        """
+        Bellman-Ford de origem única sobre a lista de arestas, aceitando
+        pesos negativos. Em vez de relaxar todas as arestas n-1 vezes, cada
+        rodada só relaxa as arestas que saem dos vértices melhorados na
+        rodada anterior (lista de trabalho, como no SPFA) e o laço termina
+        assim que uma rodada não melhora nada: O(n·m) no pior caso.
+
+        Retorna (dist, anterior). Lança CicloNegativoError, com os vértices
+        do ciclo, se houver um ciclo negativo alcançável a partir da origem.
+        """
+        dist = [float('inf')] * self.n
+        anterior = [None] * self.n
+        dist[origem] = 0
+        self.rodadas = self._relaxar_em_rodadas(dist, anterior, [origem])
+        return dist, anterior
+
+    def _relaxar_em_rodadas(self, dist, anterior, fronteira):
+        """
+        Laço de rodadas do bellman_ford a partir da fronteira inicial
+        (dist e anterior são alterados no lugar). Retorna o número de rodadas.
+        """
+        saidas = self._lista_de_saida()
+        # marca[w] guarda a rodada em que w entrou na próxima fronteira
+        marca = [0] * self.n
+        rodadas = 0
+        while fronteira:
+            rodadas += 1
+            if rodadas > self.n:
+                # Seguindo 'anterior' a partir de um vértice ainda melhorando chega-se ao ciclo
+                ciclo = extrair_ciclo(fronteira[0], lambda v: anterior[v], self.n)
+                raise CicloNegativoError(ciclo[::-1])
+            proxima = []
+            for v in fronteira:
+                for w, weight in saidas[v]:
+                    if dist[v] + weight < dist[w]:
+                        dist[w] = dist[v] + weight
+                        anterior[w] = v
+                        if marca[w] != rodadas:
+                            marca[w] = rodadas
+                            proxima.append(w)
+            fronteira = proxima
+        return rodadas
+
+    def potenciais_johnson(self):
+        """
+        Potenciais h de Johnson: distâncias a partir de um vértice virtual
+        ligado a todos os vértices com custo 0, calculadas pelo mesmo laço
+        de rodadas do bellman_ford. Com eles peso + h[v] - h[w] >= 0 em
+        toda aresta vw. Lança CicloNegativoError se houver ciclo negativo.
+        """
+        h = [0] * self.n
+        self._relaxar_em_rodadas(h, [None] * self.n, list(range(self.n)))
+        return h
+
+    def johnson(self, num_workers = None):
+        """
+        Todos os pares pelo algoritmo de Johnson: potenciais por
+        Bellman-Ford, reponderação para pesos não-negativos e um Dijkstra
+        com heap de cada origem, distribuídos num pool de processos
+        (num_workers=None usa os.cpu_count(); 1 executa no processo atual).
+        O(n·m log n) no total.
+
+        Preenche self.dist e a matriz de roteamento self.M no mesmo formato
+        do motor 'floyd-warshall', prontos para reconstruir_caminho.
+        """
+        potenciais = self.potenciais_johnson()
+        saidas = self._lista_de_saida()
+        saidas = [saidas[v] for v in range(self.n)]
+        resultados = johnson.todos_os_pares(saidas, potenciais, num_workers)
+        self.cache_rotas.limpar()
+        for origem, (dist, saltos) in enumerate(resultados):
+            self.dist[origem] = dist
+            linha_M = self.M[origem]
+            for destino, salto in enumerate(saltos):
+                if salto is not None:
+                    linha_M[destino] = salto
+        self.todos_os_pares = 'johnson'
+
+    def bellman_ford_vetorizado(self, origem):
+        """
+        Bellman-Ford de origem única com as arestas em arrays paralelos
+        (origem, destino, peso). Cada rodada relaxa todas as arestas de uma
+        vez: calcula dist[src] + peso para o array inteiro e aplica um
+        scatter-min (np.minimum.at) sobre dist[dst]. O laço termina quando
+        uma rodada não muda nada; se a rodada n ainda mudar alguma
+        distância, há um ciclo negativo.
+
+        Mesmo retorno e mesmas exceções de bellman_ford; o número de rodadas
+        fica em self.rodadas. Requer NumPy.
+        """
+        if np is None:
+            raise ImportError("O motor 'vetorizado' requer o pacote NumPy instalado.")
+        src = np.asarray(self.arestas.origem, dtype=np.int64)
+        dst = np.asarray(self.arestas.destino, dtype=np.int64)
+        peso = np.asarray(self.arestas.custo, dtype=np.float64)
+
+        dist = np.full(self.n, np.inf)
+        dist[origem] = 0
+        anterior = np.full(self.n, -1, dtype=np.int64)
+
+        rodadas = 0
+        while True:
+            rodadas += 1
+            candidatos = dist[src] + peso
+            nova = dist.copy()
+            np.minimum.at(nova, dst, candidatos)
+            # Arestas que venceram nesta rodada definem o anterior do destino
+            vencedoras = (candidatos < dist[dst]) & (candidatos == nova[dst])
+            if not vencedoras.any():
+                break
+            anterior[dst[vencedoras]] = src[vencedoras]
+            if rodadas == self.n:
+                # Rodada extra: com n vértices, n-1 rodadas bastam sem ciclo negativo
+                melhorado = int(dst[vencedoras][0])
+                ciclo = extrair_ciclo(melhorado, lambda v: int(anterior[v]), self.n)
+                raise CicloNegativoError(ciclo[::-1])
+            dist = nova
+
+        self.rodadas = rodadas
+        distancias = [int(d) if d != np.inf else float('inf') for d in dist.tolist()]
+        return distancias, [None if v == -1 else v for v in anterior.tolist()]
+
+    def CaminhoMinimo(self, origem, destino, motor = 'spfa'):
+        """
+        Caminho mínimo e seu custo de origem até destino.
+
+        motor='spfa' (padrão) resolve só a origem pedida com bellman_ford;
+        motor='vetorizado' faz o mesmo com bellman_ford_vetorizado;
+        motor='johnson' resolve todos os pares uma única vez com johnson()
+        e depois só consulta self.dist e self.M;
+        motor='floyd-warshall' calcula todos os pares em self.dist e a
+        matriz de roteamento self.M, como no pseudocódigo. Se uma entrada da
+        diagonal de self.dist ficar negativa, o laço é interrompido na hora
+        e CicloNegativoError é lançada com o ciclo lido de self.M (self.dist
+        fica no estado parcial em que o ciclo foi detectado).
+        """
+        if motor in ('spfa', 'vetorizado'):
+            if motor == 'spfa':
+                dist, anterior = self.bellman_ford(origem)
+            else:
+                dist, anterior = self.bellman_ford_vetorizado(origem)
+            if dist[destino] == float('inf'):
+                return None, dist[destino]
+            caminho = [destino]
+            while caminho[-1] != origem:
+                caminho.append(anterior[caminho[-1]])
+            return caminho[::-1], dist[destino]
+
+        if motor == 'johnson':
+            if self.todos_os_pares is None:
+                self.johnson()
+            return self.reconstruir_caminho(origem, destino), self.dist[origem][destino]
+
+        if motor != 'floyd-warshall':
+            raise ValueError(f"Motor desconhecido: '{motor}'.")
+
         matriz_dist = self.dist
+        self.cache_rotas.limpar()
         
-        for k in range(self.nos[0]):
-            for i in range(self.nos[0]):
-                for j in range(self.nos[0]):
+        for k in range(self.n):
+            for i in range(self.n):
+                for j in range(self.n):
                     if matriz_dist[i][k] + matriz_dist[k][j] < matriz_dist[i][j]:
                         matriz_dist[i][j] = matriz_dist[i][k] + matriz_dist[k][j]
                         self.M[i][j] = self.M[i][k]
+                        if i == j and matriz_dist[i][i] < 0:
+                            # d_ii < 0: há um ciclo negativo passando por i
+                            raise CicloNegativoError(
+                                extrair_ciclo(i, lambda v: self.M[v][i], self.n))
+
+        self.todos_os_pares = 'floyd-warshall'
 
-        origem = 0
-        destino = 6
-        
         # 1. Custo mínimo
         custo_minimo = self.dist[origem][destino]
         
@@ -66,21 +268,56 @@ class BellmanFord(ReadFile, GraphAdjMatrix):
         return caminho, custo_minimo
 
     def reconstruir_caminho(self, origem, destino):
-        """Reconstrói o caminho usando a matriz de roteamento R"""
+        """
+        Reconstrói o caminho usando a matriz de roteamento R. A caminhada
+        para no primeiro vértice cujo caminho até o destino já está em
+        self.cache_rotas e reaproveita esse sufixo; o caminho de cada vértice
+        percorrido até o destino é guardado no cache para as próximas consultas.
+        """
         if self.dist[origem][destino] == float('inf'):
             return None  
         
-        caminho = [origem]
+        prefixo = []
         atual = origem
         
-        while atual != destino:
+        while True:
+            sufixo = self.cache_rotas.obter(atual, destino)
+            if sufixo is not None:
+                break
+            prefixo.append(atual)
+            if atual == destino:
+                sufixo = ()
+                break
+            if len(prefixo) > self.n:
+                # Um caminho simples tem no máximo n vértices: a rota entrou num ciclo
+                raise CicloNegativoError(extrair_ciclo(origem, lambda v: self.M[v][destino], self.n))
             atual = self.M[atual][destino]
-            caminho.append(atual)
         
-        return caminho
+        caminho = tuple(prefixo) + sufixo
+        for inicio, vertice in enumerate(prefixo):
+            self.cache_rotas.guardar(vertice, destino, caminho, inicio)
+        return list(caminho)
+
+    def exportar_caminhos(self, caminho_arquivo):
+        """
+        Grava os n² caminhos mínimos num arquivo compacto (deslocamentos +
+        array de vértices, ver rotas.py), coluna a coluna, com memória
+        limitada a uma coluna de caminhos. Se nenhum motor de todos os
+        pares foi executado ainda, resolve antes com johnson().
+        Retorna o total de vértices gravados.
+        """
+        if self.todos_os_pares is None:
+            self.johnson()
+        return exportar_caminhos(self.n, self.M, self.dist, caminho_arquivo)
     
 
-objeto = BellmanFord()
-caminho, custo_minimo = objeto.CaminhoMinimo()
-print(f'O caminho mínimo partindo de 0 até 6: {",".join( map(str,caminho))} \n'
-      f'Custo mínimo saindo de 0 até 6: {custo_minimo}')
\ No newline at end of file
+if __name__ == "__main__":
+    origem, destino = 0, 6
+    objeto = BellmanFord()
+    try:
+        caminho, custo_minimo = objeto.CaminhoMinimo(origem, destino)
+    except CicloNegativoError as erro:
+        print(f'Caminho mínimo indefinido. {erro}')
+        raise SystemExit(1)
+    print(f'O caminho mínimo partindo de {origem} até {destino}: {",".join( map(str,caminho))} \n'
+          f'Custo mínimo saindo de {origem} até {destino}: {custo_minimo}')
\ No newline at end of file
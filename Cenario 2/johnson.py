@@ -0,0 +1,85 @@
+"""
+Dijkstra de cada origem para o motor de Johnson do cenário 2.
+
+Os pesos já chegam reponderados pelos potenciais h (custo + h[v] - h[w] é
+sempre >= 0), então cada origem é resolvida por um Dijkstra com heap
+binário. As origens são independentes e podem ser distribuídas num pool
+de processos; cada processo recebe a lista de saída e os potenciais uma
+única vez, pelo inicializador.
+
+A lista de saída é indexada de 0 a n-1: saidas[v] = [(w, peso), ...].
+"""
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+INFINITO = float('inf')
+
+
+def dijkstra_reponderado(saidas, potenciais, origem):
+    """
+    Dijkstra a partir de 'origem' com os pesos reponderados por 'potenciais'.
+
+    Retorna (dist, saltos): dist com os custos originais (INFINITO se
+    inalcançável) e saltos[w] com o vértice seguinte à origem no caminho
+    até w (None se inalcançável ou w == origem), ou seja, uma linha da
+    matriz de roteamento M.
+    """
+    n = len(saidas)
+    dist = [INFINITO] * n
+    dist[origem] = 0
+    saltos = [None] * n
+    fechado = [False] * n
+    heap = [(0, origem)]
+    while heap:
+        d_v, v = heapq.heappop(heap)
+        if fechado[v]:
+            continue
+        fechado[v] = True
+        h_v = potenciais[v]
+        for w, peso in saidas[v]:
+            nova = d_v + peso + h_v - potenciais[w]
+            if nova < dist[w]:
+                dist[w] = nova
+                saltos[w] = w if v == origem else saltos[v]
+                heapq.heappush(heap, (nova, w))
+
+    # Desfaz a reponderação: d(o, w) = d'(o, w) - h[o] + h[w]
+    h_origem = potenciais[origem]
+    dist = [d - h_origem + potenciais[w] if d != INFINITO else INFINITO
+            for w, d in enumerate(dist)]
+    return dist, saltos
+
+
+# Estado de cada processo do pool de todos_os_pares
+_saidas_worker = None
+_potenciais_worker = None
+
+
+def _inicializar_worker(saidas, potenciais):
+    global _saidas_worker, _potenciais_worker
+    _saidas_worker, _potenciais_worker = saidas, potenciais
+
+
+def _dijkstra_worker(origem):
+    return dijkstra_reponderado(_saidas_worker, _potenciais_worker, origem)
+
+
+def todos_os_pares(saidas, potenciais, num_workers=None):
+    """
+    Executa dijkstra_reponderado de cada origem e retorna a lista de
+    resultados (dist, saltos) na ordem das origens. Com num_workers > 1
+    (None = os.cpu_count()) as origens são resolvidas em processos
+    separados; com 1, no processo atual.
+    """
+    n = len(saidas)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers == 1 or n < 2:
+        return [dijkstra_reponderado(saidas, potenciais, origem) for origem in range(n)]
+
+    with ProcessPoolExecutor(max_workers=num_workers,
+                             initializer=_inicializar_worker,
+                             initargs=(saidas, potenciais)) as pool:
+        return list(pool.map(_dijkstra_worker, range(n),
+                             chunksize=max(1, n // (4 * num_workers))))
@@ -0,0 +1,181 @@
+"""
+Reconstrução de rotas a partir da matriz de roteamento M do cenário 2.
+
+CacheDeRotas guarda, com política LRU e capacidade limitada, os caminhos
+já reconstruídos por (vértice, destino). Uma nova consulta anda por M só
+até encontrar um vértice cujo sufixo até o destino já está no cache e
+reaproveita esse sufixo, em vez de refazer a caminhada inteira. Cada
+vértice percorrido na caminhada também entra no cache, com o seu sufixo
+do caminho montado: os sufixos compartilham a tupla do caminho, então
+guardar os L sufixos de um caminho custa O(L) em tempo e memória.
+
+exportar_caminhos grava todos os n² caminhos num arquivo compacto:
+
+- cabeçalho b'ROT1', n (uint32) e o total de vértices gravados (uint64);
+- n² + 1 deslocamentos uint64: o caminho de índice k = destino * n + origem
+  ocupa as posições deslocamentos[k] a deslocamentos[k+1] do array de vértices;
+- o array de vértices, em int32 little-endian.
+
+Caminhos inexistentes ficam vazios. A exportação processa uma coluna
+(destino) de M por vez: dentro da coluna cada caminho é o vértice de
+origem seguido do caminho já montado de M[origem][destino], então cada
+vértice gravado custa O(1) e a memória fica limitada a uma coluna.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+
+INFINITO = float('inf')
+
+TAMANHO_CACHE_PADRAO = 4096
+
+_MAGICO = b'ROT1'
+# mágico, número de vértices, total de vértices gravados
+_CABECALHO = struct.Struct('<4sIQ')
+_DESLOCAMENTO = struct.Struct('<Q')
+
+
+class CacheDeRotas:
+    """
+    Cache LRU de caminhos: (vértice, destino) -> (caminho, início), em que
+    caminho[início:] são os vértices de vértice até o destino.
+    """
+
+    def __init__(self, capacidade=TAMANHO_CACHE_PADRAO):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self.capacidade = capacidade
+        self._rotas = OrderedDict()
+        self.acertos = 0
+        self.faltas = 0
+
+    def __len__(self):
+        return len(self._rotas)
+
+    def obter(self, vertice, destino):
+        """Sufixo (tupla) de vertice até destino, ou None se não estiver no cache."""
+        entrada = self._rotas.get((vertice, destino))
+        if entrada is None:
+            self.faltas += 1
+            return None
+        self._rotas.move_to_end((vertice, destino))
+        self.acertos += 1
+        caminho, inicio = entrada
+        return caminho[inicio:]
+
+    def guardar(self, vertice, destino, caminho, inicio=0):
+        """Guarda caminho[inicio:] (caminho é uma tupla) como a rota de vertice até destino."""
+        self._rotas[(vertice, destino)] = (caminho, inicio)
+        self._rotas.move_to_end((vertice, destino))
+        if len(self._rotas) > self.capacidade:
+            self._rotas.popitem(last=False)
+
+    def limpar(self):
+        """Descarta todas as rotas (M ou as distâncias mudaram)."""
+        self._rotas.clear()
+
+
+def _para_little_endian(valores):
+    if sys.byteorder == 'big':
+        valores.byteswap()
+    return valores.tobytes()
+
+
+def _coluna_de_caminhos(n, M, dist, destino):
+    """
+    Caminhos de todas as origens até 'destino', lidos da coluna 'destino' de M.
+    Retorna uma lista com a tupla de cada origem (vazia se não há caminho).
+    """
+    caminhos = [None] * n
+    caminhos[destino] = (destino,)
+    for origem in range(n):
+        if caminhos[origem] is not None:
+            continue
+        if dist[origem][destino] == INFINITO:
+            caminhos[origem] = ()
+            continue
+        # Anda até um vértice com caminho já montado e desempilha montando os prefixos
+        pilha = []
+        atual = origem
+        while caminhos[atual] is None:
+            pilha.append(atual)
+            if len(pilha) > n:
+                raise ValueError(f"A matriz de roteamento contém um ciclo na coluna {destino}.")
+            atual = M[atual][destino]
+        for vertice in reversed(pilha):
+            caminhos[vertice] = (vertice,) + caminhos[atual]
+            atual = vertice
+    return caminhos
+
+
+def exportar_caminhos(n, M, dist, caminho_arquivo):
+    """
+    Grava os n² caminhos descritos pela matriz de roteamento M (e pelas
+    distâncias dist, que indicam os pares sem caminho) no formato descrito
+    no topo do módulo. Retorna o total de vértices gravados.
+    """
+    inicio_vertices = _CABECALHO.size + _DESLOCAMENTO.size * (n * n + 1)
+    total = 0
+    with open(caminho_arquivo, 'wb') as f:
+        f.write(_CABECALHO.pack(_MAGICO, n, 0))
+        for destino in range(n):
+            deslocamentos = array('Q')
+            vertices = array('i')
+            for caminho in _coluna_de_caminhos(n, M, dist, destino):
+                deslocamentos.append(total)
+                vertices.extend(caminho)
+                total += len(caminho)
+            f.seek(_CABECALHO.size + _DESLOCAMENTO.size * destino * n)
+            f.write(_para_little_endian(deslocamentos))
+            f.seek(inicio_vertices + 4 * (total - len(vertices)))
+            f.write(_para_little_endian(vertices))
+        f.seek(_CABECALHO.size + _DESLOCAMENTO.size * n * n)
+        f.write(_DESLOCAMENTO.pack(total))
+        f.seek(0)
+        f.write(_CABECALHO.pack(_MAGICO, n, total))
+    return total
+
+
+class CaminhosExportados:
+    """
+    Leitura, via mmap, de um arquivo gravado por exportar_caminhos: cada
+    consulta decodifica só os vértices do caminho pedido.
+    """
+
+    def __init__(self, caminho_arquivo):
+        self._arquivo = open(caminho_arquivo, 'rb')
+        try:
+            self._mm = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            magico, n, total = _CABECALHO.unpack_from(self._mm, 0)
+            inicio_vertices = _CABECALHO.size + _DESLOCAMENTO.size * (n * n + 1)
+            if magico != _MAGICO:
+                raise ValueError(f"'{caminho_arquivo}' não é um arquivo de caminhos exportados.")
+            if len(self._mm) != inicio_vertices + 4 * total:
+                raise ValueError(f"'{caminho_arquivo}' está truncado.")
+        except Exception:
+            self._arquivo.close()
+            raise
+        self.n = n
+        self.total = total
+        self._inicio_vertices = inicio_vertices
+
+    def caminho(self, origem, destino):
+        """Caminho de origem até destino, ou None se não houver."""
+        k = destino * self.n + origem
+        inicio, fim = struct.unpack_from('<2Q', self._mm, _CABECALHO.size + _DESLOCAMENTO.size * k)
+        if inicio == fim:
+            return None
+        return list(struct.unpack_from(f'<{fim - inicio}i', self._mm,
+                                       self._inicio_vertices + 4 * inicio))
+
+    def fechar(self):
+        self._mm.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,162 @@
+"""
+Cache em disco da matriz de distâncias mínimas.
+
+A matriz resolvida é gravada num formato binário de largura fixa: um
+cabeçalho seguido de n x n inteiros int32 little-endian, com um valor
+sentinela no lugar de float('inf'). O arquivo é identificado pelo hash
+SHA-256 do arquivo de trechos, então qualquer mudança na rede gera uma
+nova entrada.
+
+Nas execuções seguintes o arquivo é aberto com mmap e as consultas (uma
+linha, uma distância ou encontrar_estacao_central) leem direto do buffer
+mapeado, sem desserializar a matriz inteira.
+"""
+import hashlib
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só como_array() depende dele.
+    np = None
+
+INFINITO = float('inf')
+
+# Valor int32 que representa a ausência de caminho (infinito)
+SENTINELA_INFINITO = 2**31 - 1
+
+_MAGICO = b'FWD1'
+# mágico, número de estações, sentinela
+_CABECALHO = struct.Struct('<4sIi')
+_INT32 = struct.Struct('<i')
+
+DIRETORIO_CACHE_PADRAO = '.cache_distancias'
+
+
+def hash_arquivo(caminho_arquivo):
+    """SHA-256 do conteúdo do arquivo de trechos (a chave do cache)."""
+    h = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def caminho_cache(caminho_arquivo, diretorio_cache=None):
+    """Caminho do arquivo de cache correspondente ao arquivo de trechos."""
+    if diretorio_cache is None:
+        diretorio_cache = os.path.join(os.path.dirname(caminho_arquivo), DIRETORIO_CACHE_PADRAO)
+    return os.path.join(diretorio_cache, hash_arquivo(caminho_arquivo) + '.fwd')
+
+
+def _linha_para_int32(linha):
+    valores = []
+    for valor in linha:
+        if valor == INFINITO:
+            valores.append(SENTINELA_INFINITO)
+            continue
+        inteiro = int(valor)
+        if inteiro != valor or not -2**31 <= inteiro < SENTINELA_INFINITO:
+            raise ValueError(f"Distância {valor} não pode ser gravada como int32.")
+        valores.append(inteiro)
+    return valores
+
+
+def salvar_matriz(matriz, caminho):
+    """
+    Grava a matriz (lista de linhas, array NumPy ou matriz mapeada) no
+    formato binário do cache. A gravação é atômica: o arquivo final só
+    aparece depois de completamente escrito.
+    """
+    n = len(matriz)
+    formato_linha = struct.Struct(f'<{n}i')
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(_CABECALHO.pack(_MAGICO, n, SENTINELA_INFINITO))
+        for linha in matriz:
+            f.write(formato_linha.pack(*_linha_para_int32(linha)))
+    os.replace(temporario, caminho)
+
+
+class MatrizDistanciasMapeada:
+    """
+    Matriz de distâncias somente-leitura sobre um arquivo mapeado com mmap.
+
+    Cada acesso a matriz[i] decodifica apenas a linha i (com INFINITO no
+    lugar da sentinela); distancia(i, j) lê um único int32. Pode ser usada
+    onde se espera a matriz_custos de RedeDeMetro para leitura, inclusive em
+    encontrar_estacao_central e formatar_impressao_matriz.
+    """
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._arquivo = open(caminho, 'rb')
+        self._mm = None
+        try:
+            # mmap de um arquivo vazio também lança ValueError
+            self._mm = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mm) < _CABECALHO.size:
+                raise ValueError(f"'{caminho}' está truncado.")
+            magico, n, sentinela = _CABECALHO.unpack_from(self._mm, 0)
+            if magico != _MAGICO or sentinela != SENTINELA_INFINITO:
+                raise ValueError(f"'{caminho}' não é um arquivo de cache de distâncias válido.")
+            if len(self._mm) != _CABECALHO.size + 4 * n * n:
+                raise ValueError(f"'{caminho}' está truncado.")
+        except Exception:
+            if self._mm is not None:
+                self._mm.close()
+            self._arquivo.close()
+            raise
+        self.n = n
+        self._formato_linha = struct.Struct(f'<{n}i')
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        deslocamento = _CABECALHO.size + 4 * self.n * i
+        return [INFINITO if valor == SENTINELA_INFINITO else valor
+                for valor in self._formato_linha.unpack_from(self._mm, deslocamento)]
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+    def distancia(self, i, j):
+        """Distância da estação i para j (índices 0-based)."""
+        valor = _INT32.unpack_from(self._mm, _CABECALHO.size + 4 * (self.n * i + j))[0]
+        return INFINITO if valor == SENTINELA_INFINITO else valor
+
+    def como_array(self):
+        """
+        Visão NumPy int32 (n x n) direto sobre o buffer mapeado, sem cópia.
+        As posições sem caminho contêm SENTINELA_INFINITO.
+        """
+        if np is None:
+            raise ImportError("como_array requer o pacote NumPy instalado.")
+        return np.frombuffer(self._mm, dtype='<i4', count=self.n * self.n,
+                             offset=_CABECALHO.size).reshape(self.n, self.n)
+
+    def fechar(self):
+        self._mm.close()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def abrir_cache(caminho_arquivo, diretorio_cache=None):
+    """Abre a matriz em cache do arquivo de trechos, ou retorna None se não houver."""
+    caminho = caminho_cache(caminho_arquivo, diretorio_cache)
+    if not os.path.exists(caminho):
+        return None
+    return MatrizDistanciasMapeada(caminho)
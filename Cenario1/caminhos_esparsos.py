@@ -0,0 +1,180 @@
+"""
+Motor de caminhos mínimos para todos os pares em grafos esparsos.
+
+Em vez da matriz n x n e do O(n³) do Floyd-Warshall, executa um Dijkstra
+com heap binário (heapq) a partir de cada origem sobre a lista de
+adjacência: O(n·m log n). Quando há pesos negativos usa a reponderação de
+Johnson (potenciais calculados por Bellman-Ford a partir de um vértice
+virtual) para que o Dijkstra continue válido.
+
+estacao_central_streaming encontra a estação central sem montar a matriz:
+calcula uma linha de distâncias por vez e guarda só a melhor soma.
+
+A lista de adjacência é indexada de 0 a n-1: adjacencia[v] = {w: custo}.
+"""
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+INFINITO = float('inf')
+
+# Acima desta densidade (m / n²) o Floyd-Warshall é preferido ao motor esparso.
+LIMIAR_DENSIDADE = 0.1
+
+
+def densidade(adjacencia):
+    """Densidade m / n², contando cada trecho não-direcionado uma vez."""
+    n = len(adjacencia)
+    if n == 0:
+        return 0.0
+    arcos = sum(len(vizinhos) for vizinhos in adjacencia)
+    return (arcos / 2) / (n * n)
+
+
+def escolher_algoritmo(adjacencia, limiar=LIMIAR_DENSIDADE):
+    """
+    Escolhe o motor de todos os pares pela densidade do grafo:
+    'floyd-warshall' para grafos densos, 'dijkstra' para esparsos com pesos
+    não-negativos e 'johnson' para esparsos com algum peso negativo.
+    """
+    if densidade(adjacencia) > limiar:
+        return 'floyd-warshall'
+    if tem_peso_negativo(adjacencia):
+        return 'johnson'
+    return 'dijkstra'
+
+
+def tem_peso_negativo(adjacencia):
+    return any(custo < 0 for vizinhos in adjacencia for custo in vizinhos.values())
+
+
+def dijkstra_origem(adjacencia, origem, potenciais=None, com_saltos=False):
+    """
+    Dijkstra com heap binário a partir de 'origem'. Retorna a lista de
+    distâncias (INFINITO para estações inalcançáveis).
+
+    Com 'potenciais' (reponderação de Johnson) o custo de cada aresta vw é
+    custo + h[v] - h[w] e as distâncias são corrigidas de volta ao final.
+    Com com_saltos=True retorna também, para cada destino, o primeiro salto
+    a partir da origem (-1 se inalcançável), ou seja, uma linha da matriz de
+    próximos saltos.
+    """
+    n = len(adjacencia)
+    dist = [INFINITO] * n
+    dist[origem] = 0
+    saltos = [-1] * n
+    saltos[origem] = origem
+    fechado = [False] * n
+    heap = [(0, origem)]
+    while heap:
+        d_v, v = heapq.heappop(heap)
+        if fechado[v]:
+            continue
+        fechado[v] = True
+        for w, custo in adjacencia[v].items():
+            if potenciais is not None:
+                custo = custo + potenciais[v] - potenciais[w]
+            nova = d_v + custo
+            if nova < dist[w]:
+                dist[w] = nova
+                saltos[w] = w if v == origem else saltos[v]
+                heapq.heappush(heap, (nova, w))
+
+    if potenciais is not None:
+        h_origem = potenciais[origem]
+        dist = [d - h_origem + potenciais[w] if d != INFINITO else INFINITO
+                for w, d in enumerate(dist)]
+    if com_saltos:
+        return dist, saltos
+    return dist
+
+
+def potenciais_johnson(adjacencia):
+    """
+    Bellman-Ford a partir de um vértice virtual ligado a todos com custo 0.
+    Retorna os potenciais h; lança ValueError se houver ciclo negativo.
+    """
+    n = len(adjacencia)
+    h = [0] * n
+    for _ in range(n):
+        mudou = False
+        for v in range(n):
+            for w, custo in adjacencia[v].items():
+                if h[v] + custo < h[w]:
+                    h[w] = h[v] + custo
+                    mudou = True
+        if not mudou:
+            return h
+    raise ValueError("A rede contém um ciclo de custo negativo.")
+
+
+def todos_os_pares(adjacencia, com_saltos=False):
+    """
+    Distâncias mínimas entre todos os pares por Dijkstra repetido (ou
+    Johnson, se houver pesos negativos). Retorna uma lista de linhas; com
+    com_saltos=True, retorna (linhas de distâncias, linhas de próximos saltos).
+    """
+    potenciais = potenciais_johnson(adjacencia) if tem_peso_negativo(adjacencia) else None
+    resultados = [dijkstra_origem(adjacencia, origem, potenciais, com_saltos)
+                  for origem in range(len(adjacencia))]
+    if com_saltos:
+        return [dist for dist, _ in resultados], [saltos for _, saltos in resultados]
+    return resultados
+
+
+# Estado de cada processo do pool de estacao_central_streaming
+_adjacencia_worker = None
+_potenciais_worker = None
+
+
+def _inicializar_worker(adjacencia, potenciais):
+    global _adjacencia_worker, _potenciais_worker
+    _adjacencia_worker, _potenciais_worker = adjacencia, potenciais
+
+
+def _soma_linha_worker(origem):
+    return sum(dijkstra_origem(_adjacencia_worker, origem, _potenciais_worker))
+
+
+def estacao_central_streaming(adjacencia, num_workers=1):
+    """
+    Estação central (menor soma de distâncias) sem a matriz n x n.
+
+    Cada linha de distâncias é calculada por um Dijkstra de origem única e
+    descartada logo após somada; só a melhor soma e seu índice são mantidos,
+    então a memória é O(n + m). Com num_workers > 1 (None = os.cpu_count())
+    as linhas são avaliadas em processos separados. Retorna a mesma tupla de
+    RedeDeMetro.encontrar_estacao_central, com estações numeradas a partir de 1.
+    """
+    n = len(adjacencia)
+    potenciais = potenciais_johnson(adjacencia) if tem_peso_negativo(adjacencia) else None
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    melhor_idx = -1
+    menor_soma = INFINITO
+
+    def considerar(somas):
+        nonlocal melhor_idx, menor_soma
+        for origem, soma in enumerate(somas):
+            if soma < menor_soma:
+                menor_soma, melhor_idx = soma, origem
+
+    if num_workers == 1 or n < 2:
+        considerar(sum(dijkstra_origem(adjacencia, origem, potenciais)) for origem in range(n))
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_inicializar_worker,
+                                 initargs=(adjacencia, potenciais)) as pool:
+            # map preserva a ordem das origens, mantendo o desempate do modo sequencial
+            considerar(pool.map(_soma_linha_worker, range(n),
+                                chunksize=max(1, n // (4 * num_workers))))
+
+    if melhor_idx == -1:
+        return None, [], None, INFINITO
+
+    # Só a linha vencedora é recalculada e devolvida
+    vetor_distancias = dijkstra_origem(adjacencia, melhor_idx, potenciais)
+    distancia_maxima = max(vetor_distancias)
+    no_mais_distante = vetor_distancias.index(distancia_maxima) + 1
+    return melhor_idx + 1, vetor_distancias, no_mais_distante, distancia_maxima
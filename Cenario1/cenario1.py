@@ -1,4 +1,14 @@
+import os
 import sys
+from array import array
+from itertools import islice
+
+from uteis import np, resolver_backend, floyd_warshall_numpy
+from fw_blocado import floyd_warshall_blocado, TAMANHO_BLOCO_PADRAO
+from caminhos_esparsos import (densidade, dijkstra_origem, escolher_algoritmo,
+                               estacao_central_streaming, todos_os_pares)
+from cache_distancias import MatrizDistanciasMapeada, SENTINELA_INFINITO, caminho_cache, salvar_matriz
+from leitor_arestas import ler_arestas
 
 # Usamos um valor alto para representar a ausência de conexão direta (infinito).
 INFINITO = float('inf')
@@ -10,69 +20,463 @@ class RedeDeMetro:
     """
     def __init__(self, num_estacoes):
         self.num_estacoes = num_estacoes
-        # Matriz de distâncias 'D' do pseudocódigo
-        self.matriz_custos = [[INFINITO] * num_estacoes for _ in range(num_estacoes)]
+        # Lista de adjacência: adjacencia[i] = {j: custo} (índices 0-based)
+        self.adjacencia = [{} for _ in range(num_estacoes)]
+        # Matriz de distâncias 'D' do pseudocódigo, alocada só quando usada
+        self._matriz_custos = None
+        # Motor escolhido na última chamada de calcular_todas_rotas
+        self.algoritmo_usado = None
+        # True enquanto matriz_custos contém as distâncias mínimas atualizadas
+        self._resolvida = False
+        # Soma de cada linha da matriz resolvida, mantida entre edições
+        self._somas_linhas = None
+        # Cópia NumPy da matriz em listas, usada pelas consultas em lote
+        self._matriz_array = None
+        # Matriz de próximos saltos: proximo_salto[i][j] é a estação seguinte
+        # a i no caminho mínimo até j (-1 se inalcançável). Só é preenchida
+        # quando as rotas são calculadas com com_rotas=True.
+        self.proximo_salto = None
+
+    @property
+    def matriz_custos(self):
+        if self._matriz_custos is None:
+            matriz = [[INFINITO] * self.num_estacoes for _ in range(self.num_estacoes)]
+            for i in range(self.num_estacoes):
+                matriz[i][i] = 0
+            for i, vizinhos in enumerate(self.adjacencia):
+                for j, custo in vizinhos.items():
+                    matriz[i][j] = custo
+            self._matriz_custos = matriz
+        return self._matriz_custos
+
+    @matriz_custos.setter
+    def matriz_custos(self, matriz):
+        self._fechar_matriz_mapeada(matriz)
+        self._matriz_custos = matriz
+        self._resolvida = False
+        self._somas_linhas = None
+        self._matriz_array = None
+        self.proximo_salto = None
 
-        for i in range(num_estacoes):
-            self.matriz_custos[i][i] = 0
+    def _fechar_matriz_mapeada(self, nova=None):
+        """Libera o mmap da matriz do cache quando ela deixa de ser a matriz da rede."""
+        antiga = self._matriz_custos
+        if isinstance(antiga, MatrizDistanciasMapeada) and antiga is not nova:
+            antiga.fechar()
+
+    def _tipo_salto(self):
+        """Menor inteiro com sinal que indexa as estações: 2 bytes até 32767, senão 4."""
+        return 'h' if self.num_estacoes < 2**15 else 'i'
+
+    def _proximos_saltos_iniciais(self, matriz):
+        """Matriz de próximos saltos inicial: j se há trecho direto i-j, -1 se não."""
+        n = self.num_estacoes
+        if np is not None and isinstance(matriz, np.ndarray):
+            proximo = np.where(np.isinf(matriz), -1, np.arange(n)[None, :]).astype(self._tipo_salto())
+            proximo[np.arange(n), np.arange(n)] = np.arange(n)
+            return proximo
+        tipo = self._tipo_salto()
+        return [array(tipo, [j if i == j or custo != INFINITO else -1 for j, custo in enumerate(linha)])
+                for i, linha in enumerate(matriz)]
 
     def adicionar_trecho(self, estacao_a, estacao_b, custo):
-        """ Adiciona uma conexão (aresta) não-direcionada entre duas estações. """
+        """
+        Adiciona (ou altera o custo de) uma conexão não-direcionada entre duas
+        estações. Se as rotas já foram calculadas, a matriz de distâncias é
+        atualizada incrementalmente em vez de recalculada (ver
+        _atualizar_trecho_resolvido).
+        """
         idx_a, idx_b = estacao_a - 1, estacao_b - 1
-        self.matriz_custos[idx_a][idx_b] = custo
-        self.matriz_custos[idx_b][idx_a] = custo
+        if self._resolvida:
+            self._atualizar_trecho_resolvido(idx_a, idx_b, custo)
+            return
+
+        self.adjacencia[idx_a][idx_b] = custo
+        self.adjacencia[idx_b][idx_a] = custo
+        if self._matriz_custos is not None:
+            self._matriz_custos[idx_a][idx_b] = custo
+            self._matriz_custos[idx_b][idx_a] = custo
+
+    def remover_trecho(self, estacao_a, estacao_b):
+        """ Fecha a conexão entre duas estações, se existir. """
+        idx_a, idx_b = estacao_a - 1, estacao_b - 1
+        if idx_b not in self.adjacencia[idx_a]:
+            return
+        if self._resolvida:
+            self._atualizar_trecho_resolvido(idx_a, idx_b, INFINITO)
+            return
+
+        del self.adjacencia[idx_a][idx_b]
+        self.adjacencia[idx_b].pop(idx_a, None)
+        if self._matriz_custos is not None:
+            self._matriz_custos[idx_a][idx_b] = INFINITO if idx_a != idx_b else 0
+            self._matriz_custos[idx_b][idx_a] = INFINITO if idx_a != idx_b else 0
+
+    def _atualizar_trecho_resolvido(self, a, b, custo):
+        """
+        Mantém a matriz resolvida válida após mudar o custo do trecho a-b
+        (INFINITO = trecho fechado).
+
+        - Redução (ou trecho novo): O(n²), D[i][j] = min(D[i][j],
+          D[i][a] + custo + D[b][j], D[i][b] + custo + D[a][j]).
+        - Aumento ou remoção: só as origens com algum par cujo caminho
+          mínimo usava o trecho têm a linha recalculada (Dijkstra).
+
+        Um trecho não-direcionado de custo negativo forma sozinho o ciclo
+        negativo a-b-a, então é rejeitado sem alterar a rede.
+        """
+        if custo < 0:
+            raise ValueError("A rede contém um ciclo de custo negativo.")
+        custo_antigo = self.adjacencia[a].get(b, INFINITO)
+        if custo == INFINITO:
+            self.adjacencia[a].pop(b, None)
+            self.adjacencia[b].pop(a, None)
+        else:
+            self.adjacencia[a][b] = custo
+            self.adjacencia[b][a] = custo
+
+        if a == b or custo == custo_antigo:
+            return
+        self._matriz_array = None
+        if isinstance(self._matriz_custos, MatrizDistanciasMapeada):
+            # A matriz do cache é somente-leitura: copia para a memória antes de editar
+            copia = list(self._matriz_custos)
+            self._fechar_matriz_mapeada(copia)
+            self._matriz_custos = copia
+
+        D = self._matriz_custos
+        P = self.proximo_salto
+        n = self.num_estacoes
+        usa_numpy = np is not None and isinstance(D, np.ndarray)
+
+        if custo < custo_antigo:
+            if P is not None:
+                # Primeiro salto de i rumo ao trecho: o de i até a (ou b), ou o próprio trecho
+                salto_a = [P[i][a] if i != a else b for i in range(n)]
+                salto_b = [P[i][b] if i != b else a for i in range(n)]
+            if usa_numpy:
+                via_ab = D[:, a, None] + custo + D[None, b, :]
+                via_ba = D[:, b, None] + custo + D[None, a, :]
+                melhor_via = np.minimum(via_ab, via_ba)
+                melhora = melhor_via < D
+                if P is not None:
+                    novo_salto = np.where(via_ab <= via_ba,
+                                          np.array(salto_a, dtype=P.dtype)[:, None],
+                                          np.array(salto_b, dtype=P.dtype)[:, None])
+                    np.copyto(P, novo_salto, where=melhora)
+                np.copyto(D, melhor_via, where=melhora)
+                linhas_alteradas = np.flatnonzero(melhora.any(axis=1))
+            else:
+                coluna_a = [D[i][a] for i in range(n)]
+                coluna_b = [D[i][b] for i in range(n)]
+                linha_a, linha_b = list(D[a]), list(D[b])
+                linhas_alteradas = []
+                for i in range(n):
+                    linha, ia, ib = D[i], coluna_a[i] + custo, coluna_b[i] + custo
+                    alterada = False
+                    for j in range(n):
+                        via_ab, via_ba = ia + linha_b[j], ib + linha_a[j]
+                        candidato = min(via_ab, via_ba)
+                        if candidato < linha[j]:
+                            linha[j] = candidato
+                            if P is not None:
+                                P[i][j] = salto_a[i] if via_ab <= via_ba else salto_b[i]
+                            alterada = True
+                    if alterada:
+                        linhas_alteradas.append(i)
+        else:
+            if usa_numpy:
+                usa_ab = D == D[:, a, None] + custo_antigo + D[None, b, :]
+                usa_ba = D == D[:, b, None] + custo_antigo + D[None, a, :]
+                afetadas = ((usa_ab | usa_ba) & (D < INFINITO)).any(axis=1)
+                linhas_alteradas = np.flatnonzero(afetadas)
+            else:
+                linhas_alteradas = [
+                    i for i in range(n)
+                    if any(d != INFINITO and (d == D[i][a] + custo_antigo + D[b][j] or
+                                              d == D[i][b] + custo_antigo + D[a][j])
+                           for j, d in enumerate(D[i]))
+                ]
+            for i in linhas_alteradas:
+                if P is None:
+                    D[i] = dijkstra_origem(self.adjacencia, int(i))
+                    continue
+                D[i], saltos = dijkstra_origem(self.adjacencia, int(i), com_saltos=True)
+                P[i] = saltos if usa_numpy else array(self._tipo_salto(), saltos)
+
+        if self._somas_linhas is not None:
+            for i in linhas_alteradas:
+                self._somas_linhas[i] = D[i].sum() if usa_numpy else sum(D[i])
 
     @staticmethod
     def carregar_de_arquivo(caminho_arquivo):
         """
         Lê um arquivo de texto para criar e popular uma instância da RedeDeMetro.
+        O arquivo pode ser texto, texto gzip ou o formato binário de
+        leitor_arestas; os trechos são lidos em lote para arrays tipados.
         """
         try:
-            with open(caminho_arquivo, 'r') as f:
-                num_estacoes, num_trechos = map(int, f.readline().split())
-                rede = RedeDeMetro(num_estacoes)
-                for _ in range(num_trechos):
-                    v1, v2, custo = map(int, f.readline().split())
-                    rede.adicionar_trecho(v1, v2, custo)
-                return rede
+            arestas = ler_arestas(caminho_arquivo)
         except FileNotFoundError:
             print(f"Erro: O arquivo '{caminho_arquivo}' não foi encontrado.")
             return None
 
-    def calcular_todas_rotas_floyd_warshall(self):
+        rede = RedeDeMetro(arestas.n)
+        for v1, v2, custo in arestas:
+            rede.adicionar_trecho(v1, v2, custo)
+        return rede
+
+    @staticmethod
+    def carregar_com_cache(caminho_arquivo, diretorio_cache=None, metodo='auto'):
         """
-        Executa o algoritmo de Floyd-Warshall. Esta é a implementação
-        direta do pseudocódigo.
+        Como carregar_de_arquivo, mas já retorna a rede com as rotas
+        calculadas. A matriz resolvida fica num cache em disco identificado
+        pelo hash do arquivo de trechos (ver cache_distancias.py); se o cache
+        existir, a matriz é aberta com mmap em vez de recalculada e
+        algoritmo_usado vale 'cache'. Um arquivo de cache inválido (truncado
+        ou com cabeçalho antigo) conta como ausente: é apagado e regravado.
         """
-        for k in range(self.num_estacoes):
-            for i in range(self.num_estacoes):
-                for j in range(self.num_estacoes):
-                    custo_via_k = self.matriz_custos[i][k] + self.matriz_custos[k][j]
-                    if custo_via_k < self.matriz_custos[i][j]:
-                        self.matriz_custos[i][j] = custo_via_k
+        rede = RedeDeMetro.carregar_de_arquivo(caminho_arquivo)
+        if rede is None:
+            return None
+
+        caminho = caminho_cache(caminho_arquivo, diretorio_cache)
+        if os.path.exists(caminho):
+            try:
+                rede._matriz_custos = MatrizDistanciasMapeada(caminho)
+            except ValueError as erro:
+                print(f"Aviso: cache inválido descartado ({erro}).")
+                os.remove(caminho)
+            else:
+                rede._resolvida = True
+                rede.algoritmo_usado = 'cache'
+                return rede
+
+        rede.calcular_todas_rotas(metodo)
+        try:
+            salvar_matriz(rede.matriz_custos, caminho)
+        except ValueError as erro:
+            print(f"Aviso: a matriz não foi gravada no cache ({erro}).")
+        return rede
 
-    def encontrar_estacao_central(self):
+    def calcular_todas_rotas_floyd_warshall(self, backend='auto',
+                                            tamanho_bloco=TAMANHO_BLOCO_PADRAO,
+                                            num_workers=None, com_rotas=False):
+        """
+        Executa o algoritmo de Floyd-Warshall.
+
+        backend='numpy' guarda a matriz de custos como um array 2-D contíguo
+        e faz cada passo k como um único 'min' vetorizado; backend='python'
+        é a implementação direta do pseudocódigo. 'auto' (padrão) usa NumPy
+        quando instalado. backend='blocado' divide a matriz em ladrilhos de
+        tamanho_bloco e distribui a última fase por num_workers processos
+        (ver fw_blocado.py), indicado para redes com milhares de estações.
+
+        Com com_rotas=True o mesmo laço preenche self.proximo_salto (exceto
+        no modo blocado), usada por rota().
+        """
+        if self._resolvida:
+            # A matriz atual guarda distâncias mínimas, não os custos dos
+            # trechos: recomeça da lista de adjacência (ver matriz_custos)
+            self.matriz_custos = None
+        if backend == 'blocado':
+            if com_rotas:
+                raise ValueError("O backend 'blocado' não calcula a matriz de próximos saltos.")
+            resolver_backend('numpy')  # o modo blocado também requer NumPy
+            matriz = np.array(self.matriz_custos, dtype=np.float64)
+            self.matriz_custos = floyd_warshall_blocado(matriz, tamanho_bloco, num_workers)
+        elif resolver_backend(backend) == 'numpy':
+            matriz = np.array(self.matriz_custos, dtype=np.float64)
+            proximo = self._proximos_saltos_iniciais(matriz) if com_rotas else None
+            self.matriz_custos = floyd_warshall_numpy(matriz, proximo)
+            self.proximo_salto = proximo
+        else:
+            matriz_custos = self.matriz_custos
+            proximo = self._proximos_saltos_iniciais(matriz_custos) if com_rotas else None
+            self._somas_linhas = None
+            self._matriz_array = None
+            for k in range(self.num_estacoes):
+                for i in range(self.num_estacoes):
+                    for j in range(self.num_estacoes):
+                        custo_via_k = matriz_custos[i][k] + matriz_custos[k][j]
+                        if custo_via_k < matriz_custos[i][j]:
+                            matriz_custos[i][j] = custo_via_k
+                            if proximo is not None:
+                                proximo[i][j] = proximo[i][k]
+            self.proximo_salto = proximo
+
+        self.algoritmo_usado = 'floyd-warshall'
+        self._resolvida = True
+
+    def calcular_todas_rotas(self, metodo='auto', backend='auto', com_rotas=False):
+        """
+        Calcula as distâncias mínimas entre todos os pares de estações.
+
+        metodo='auto' escolhe pela densidade m/n² da rede (ver
+        caminhos_esparsos.escolher_algoritmo): Floyd-Warshall para redes
+        densas, Dijkstra repetido com heap para redes esparsas e Johnson
+        quando há custos negativos. Também aceita 'floyd-warshall',
+        'dijkstra' e 'johnson'. O motor usado é retornado e guardado em
+        self.algoritmo_usado. com_rotas=True preenche também
+        self.proximo_salto.
+        """
+        if metodo == 'auto':
+            metodo = escolher_algoritmo(self.adjacencia)
+
+        if metodo == 'floyd-warshall':
+            self.calcular_todas_rotas_floyd_warshall(backend, com_rotas=com_rotas)
+        elif metodo in ('dijkstra', 'johnson'):
+            if com_rotas:
+                self.matriz_custos, saltos = todos_os_pares(self.adjacencia, com_saltos=True)
+                self.proximo_salto = [array(self._tipo_salto(), linha) for linha in saltos]
+            else:
+                self.matriz_custos = todos_os_pares(self.adjacencia)
+            self._resolvida = True
+        else:
+            raise ValueError(f"Método desconhecido: '{metodo}'.")
+
+        self.algoritmo_usado = metodo
+        return metodo
+
+    def rota(self, origem, destino):
+        """
+        Estações do caminho mínimo de origem até destino (ambas inclusive),
+        seguindo a matriz de próximos saltos em O(comprimento do caminho).
+        Retorna None se o destino for inalcançável.
+        """
+        if self.proximo_salto is None:
+            raise ValueError("Rotas não calculadas: use calcular_todas_rotas(com_rotas=True).")
+        atual, alvo = origem - 1, destino - 1
+        if self.proximo_salto[atual][alvo] == -1:
+            return None
+
+        caminho = [origem]
+        while atual != alvo:
+            atual = int(self.proximo_salto[atual][alvo])
+            caminho.append(atual + 1)
+        return caminho
+
+    def consultar_lote(self, pares, com_caminhos=False, tamanho_lote=65536):
+        """
+        Custos (e, opcionalmente, caminhos) de muitos pares (origem, destino)
+        de uma vez, com estações numeradas a partir de 1.
+
+        'pares' pode ser uma lista de tuplas ou um array NumPy k x 2: com
+        NumPy os custos saem de uma única indexação vetorizada da matriz.
+        Retorna a lista/array de custos, ou (custos, caminhos) com
+        com_caminhos=True (caminhos exigem rotas calculadas, ver rota()).
+
+        Se 'pares' for um iterador/gerador, a consulta é feita em fluxo: a
+        função devolve um gerador que produz o resultado de cada bloco de
+        até tamanho_lote pares, mantendo a memória constante.
+        """
+        if not self._resolvida:
+            raise ValueError("Rotas não calculadas: chame calcular_todas_rotas antes de consultar.")
+        if isinstance(pares, (list, tuple)) or (np is not None and isinstance(pares, np.ndarray)):
+            return self._consultar_bloco(pares, com_caminhos)
+        return self._consultar_em_fluxo(iter(pares), com_caminhos, tamanho_lote)
+
+    def _consultar_em_fluxo(self, pares, com_caminhos, tamanho_lote):
+        while True:
+            bloco = list(islice(pares, tamanho_lote))
+            if not bloco:
+                return
+            yield self._consultar_bloco(bloco, com_caminhos)
+
+    def _consultar_bloco(self, pares, com_caminhos):
+        matriz = self._matriz_custos
+        n = self.num_estacoes
+        if np is not None:
+            indices = np.asarray(pares, dtype=np.intp).reshape(-1, 2) - 1
+            if indices.size and (indices.min() < 0 or indices.max() >= n):
+                raise ValueError(f"Estação fora do intervalo 1..{n}.")
+            if isinstance(matriz, MatrizDistanciasMapeada):
+                custos = matriz.como_array()[indices[:, 0], indices[:, 1]].astype(np.float64)
+                custos[custos == SENTINELA_INFINITO] = INFINITO
+            else:
+                if not isinstance(matriz, np.ndarray):
+                    # Matriz em listas (Dijkstra/Johnson ou backend 'python'):
+                    # convertida uma vez e reaproveitada até a próxima edição
+                    if self._matriz_array is None:
+                        self._matriz_array = np.array(matriz, dtype=np.float64)
+                    matriz = self._matriz_array
+                custos = matriz[indices[:, 0], indices[:, 1]]
+        else:
+            # Na matriz do cache, distancia() lê um único int32 (já com
+            # INFINITO no lugar da sentinela) em vez de decodificar a linha
+            mapeada = isinstance(matriz, MatrizDistanciasMapeada)
+            custos = []
+            for origem, destino in pares:
+                if not (1 <= origem <= n and 1 <= destino <= n):
+                    raise ValueError(f"Estação fora do intervalo 1..{n}.")
+                if mapeada:
+                    custos.append(matriz.distancia(origem - 1, destino - 1))
+                else:
+                    custos.append(matriz[origem - 1][destino - 1])
+
+        if not com_caminhos:
+            return custos
+        caminhos = [self.rota(int(origem), int(destino)) for origem, destino in pares]
+        return custos, caminhos
+
+    def encontrar_estacao_central(self, matriz=None):
         """
         Analisa a matriz de custos para determinar a estação central.
+        Aceita o resultado de qualquer motor (lista de linhas ou array NumPy);
+        por padrão usa self.matriz_custos. As somas das linhas da matriz
+        resolvida ficam guardadas e são atualizadas a cada edição de trecho,
+        então reavaliar após uma edição custa O(n).
         """
+        somas = None
+        if matriz is None:
+            matriz = self.matriz_custos
+            somas = self._somas_linhas
+
+        if somas is None:
+            if np is not None and isinstance(matriz, np.ndarray):
+                # Matriz do backend NumPy: somas das linhas de uma só vez
+                somas = matriz.sum(axis=1)
+            elif np is not None and isinstance(matriz, MatrizDistanciasMapeada):
+                # Matriz do cache: soma direto sobre o buffer mapeado, sem
+                # decodificar as linhas; linhas com a sentinela somam INFINITO
+                valores = matriz.como_array()
+                somas = valores.sum(axis=1, dtype=np.int64).astype(np.float64)
+                somas[(valores == SENTINELA_INFINITO).any(axis=1)] = INFINITO
+            else:
+                somas = [sum(linha) for linha in matriz]
+            if matriz is self._matriz_custos and self._resolvida:
+                self._somas_linhas = somas
+
         melhor_candidata_idx = -1
         menor_soma_distancias = INFINITO
-        for i in range(self.num_estacoes):
-            soma_atual = sum(self.matriz_custos[i])
-            if soma_atual < menor_soma_distancias:
-                menor_soma_distancias = soma_atual
-                melhor_candidata_idx = i
+        if np is not None and isinstance(somas, np.ndarray):
+            if len(somas) and somas.min() < INFINITO:
+                melhor_candidata_idx = int(somas.argmin())
+        else:
+            for i, soma_atual in enumerate(somas):
+                if soma_atual < menor_soma_distancias:
+                    menor_soma_distancias = soma_atual
+                    melhor_candidata_idx = i
         
         if melhor_candidata_idx == -1:
             return None, [], None, INFINITO
 
         estacao_central_id = melhor_candidata_idx + 1
-        vetor_distancias_central = self.matriz_custos[melhor_candidata_idx]
+        vetor_distancias_central = matriz[melhor_candidata_idx]
         distancia_maxima_final = max(vetor_distancias_central)
-        no_mais_distante_id = vetor_distancias_central.index(distancia_maxima_final) + 1
+        no_mais_distante_id = list(vetor_distancias_central).index(distancia_maxima_final) + 1
         
         return estacao_central_id, vetor_distancias_central, no_mais_distante_id, distancia_maxima_final
 
+    def encontrar_estacao_central_streaming(self, num_workers=1):
+        """
+        Mesmo resultado de encontrar_estacao_central, mas sem a matriz de
+        custos: uma linha de distâncias por vez (Dijkstra de origem única),
+        com memória O(n + m). Indicado para redes cuja matriz não cabe na
+        memória; num_workers > 1 avalia as linhas em processos paralelos.
+        """
+        return estacao_central_streaming(self.adjacencia, num_workers)
+
 def formatar_impressao_matriz(matriz, titulo):
     """Função auxiliar para formatar e imprimir uma matriz."""
     print(f"\n{titulo}:")
@@ -88,10 +492,13 @@ def formatar_impressao_matriz(matriz, titulo):
 if __name__ == "__main__":
     # Garanta que o arquivo 'graph1.txt' está na mesma pasta que o script.
     caminho_arquivo_entrada = "graph1.txt"
-    rede_metro = RedeDeMetro.carregar_de_arquivo(caminho_arquivo_entrada)
+    rede_metro = RedeDeMetro.carregar_com_cache(caminho_arquivo_entrada)
 
     if rede_metro:
-        rede_metro.calcular_todas_rotas_floyd_warshall()
+        if rede_metro.algoritmo_usado == 'cache':
+            print(f"\nMatriz de distâncias lida do cache: {rede_metro.matriz_custos.caminho}")
+        else:
+            print(f"\nAlgoritmo escolhido (densidade {densidade(rede_metro.adjacencia):.3f}): {rede_metro.algoritmo_usado}")
         (estacao_central, vetor_distancias, vertice_distante, dist_vert_dist) = rede_metro.encontrar_estacao_central()
 
         print("\n--- Resultado da Análise da Estação Central ---")
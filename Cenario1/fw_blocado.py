@@ -0,0 +1,133 @@
+"""
+Floyd-Warshall blocado (por ladrilhos) para matrizes grandes.
+
+A matriz é dividida em blocos de tamanho_bloco x tamanho_bloco. Para cada
+bloco pivô kb são executadas as três fases clássicas:
+
+  1. o bloco diagonal (kb, kb);
+  2. os blocos da linha kb e da coluna kb, que dependem só do diagonal;
+  3. os demais blocos, independentes entre si, que dependem só dos blocos
+     da fase 2 e por isso são distribuídos num pool de processos.
+
+Os processos trabalham sobre a mesma matriz em memória compartilhada
+(multiprocessing.shared_memory), sem copiar a matriz a cada tarefa.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from uteis import np
+
+TAMANHO_BLOCO_PADRAO = 256
+
+# Estado de cada processo do pool (preenchido por _inicializar_worker)
+_shm_worker = None
+_D_worker = None
+
+
+def _inicializar_worker(nome_shm, forma):
+    """Anexa o processo à matriz em memória compartilhada."""
+    global _shm_worker, _D_worker
+    _shm_worker = shared_memory.SharedMemory(name=nome_shm)
+    _D_worker = np.ndarray(forma, dtype=np.float64, buffer=_shm_worker.buf)
+
+
+def _intervalo(bloco, b, n):
+    return bloco * b, min((bloco + 1) * b, n)
+
+
+def _fase_diagonal(D, kb, b):
+    """Fase 1: Floyd-Warshall restrito ao bloco diagonal (kb, kb)."""
+    ini, fim = _intervalo(kb, b, D.shape[0])
+    T = D[ini:fim, ini:fim]
+    for k in range(fim - ini):
+        np.minimum(T, T[:, k, None] + T[None, k, :], out=T)
+
+
+def _fase_linha_coluna(D, kb, outro, b):
+    """Fase 2: atualiza os blocos (kb, outro) da linha e (outro, kb) da coluna."""
+    n = D.shape[0]
+    k_ini, k_fim = _intervalo(kb, b, n)
+    o_ini, o_fim = _intervalo(outro, b, n)
+    diagonal = D[k_ini:k_fim, k_ini:k_fim]
+    linha = D[k_ini:k_fim, o_ini:o_fim]
+    coluna = D[o_ini:o_fim, k_ini:k_fim]
+    for k in range(k_fim - k_ini):
+        np.minimum(linha, diagonal[:, k, None] + linha[None, k, :], out=linha)
+        np.minimum(coluna, coluna[:, k, None] + diagonal[None, k, :], out=coluna)
+
+
+def _fase_restante(D, kb, bi, b):
+    """Fase 3: atualiza os blocos (bi, bj), bj != kb, de uma linha de blocos."""
+    n = D.shape[0]
+    k_ini, k_fim = _intervalo(kb, b, n)
+    i_ini, i_fim = _intervalo(bi, b, n)
+    num_blocos = -(-n // b)
+    coluna_pivo = D[i_ini:i_fim, k_ini:k_fim]
+    for bj in range(num_blocos):
+        if bj == kb:
+            continue
+        j_ini, j_fim = _intervalo(bj, b, n)
+        T = D[i_ini:i_fim, j_ini:j_fim]
+        linha_pivo = D[k_ini:k_fim, j_ini:j_fim]
+        for k in range(k_fim - k_ini):
+            np.minimum(T, coluna_pivo[:, k, None] + linha_pivo[None, k, :], out=T)
+
+
+def _tarefa_fase_restante(kb, bi, b):
+    _fase_restante(_D_worker, kb, bi, b)
+
+
+def floyd_warshall_blocado(D, tamanho_bloco=TAMANHO_BLOCO_PADRAO, num_workers=None):
+    """
+    Executa o Floyd-Warshall blocado sobre o array 2-D D (alterado no lugar).
+
+    tamanho_bloco define o lado de cada ladrilho; num_workers o número de
+    processos da fase 3 (None usa os.cpu_count(); 1 executa tudo no processo
+    atual, sem pool). Para pesos inteiros o resultado é idêntico, bit a bit,
+    ao do Floyd-Warshall tradicional.
+    """
+    if np is None:
+        raise ImportError("O Floyd-Warshall blocado requer o pacote NumPy instalado.")
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser positivo.")
+
+    n = D.shape[0]
+    num_blocos = -(-n // tamanho_bloco)
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    if num_workers == 1 or num_blocos < 3:
+        for kb in range(num_blocos):
+            _fase_diagonal(D, kb, tamanho_bloco)
+            for outro in range(num_blocos):
+                if outro != kb:
+                    _fase_linha_coluna(D, kb, outro, tamanho_bloco)
+            for bi in range(num_blocos):
+                if bi != kb:
+                    _fase_restante(D, kb, bi, tamanho_bloco)
+        return D
+
+    shm = shared_memory.SharedMemory(create=True, size=max(D.nbytes, 1))
+    try:
+        compartilhada = np.ndarray(D.shape, dtype=np.float64, buffer=shm.buf)
+        compartilhada[:] = D
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_inicializar_worker,
+                                 initargs=(shm.name, D.shape)) as pool:
+            for kb in range(num_blocos):
+                _fase_diagonal(compartilhada, kb, tamanho_bloco)
+                for outro in range(num_blocos):
+                    if outro != kb:
+                        _fase_linha_coluna(compartilhada, kb, outro, tamanho_bloco)
+                # Os blocos restantes são independentes: uma tarefa por linha de blocos
+                tarefas = [pool.submit(_tarefa_fase_restante, kb, bi, tamanho_bloco)
+                           for bi in range(num_blocos) if bi != kb]
+                for tarefa in tarefas:
+                    tarefa.result()
+        D[:] = compartilhada
+        del compartilhada
+    finally:
+        shm.close()
+        shm.unlink()
+    return D
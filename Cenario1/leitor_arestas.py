@@ -0,0 +1,193 @@
+"""
+Leitor em lote de listas de arestas (formato 'n m' seguido de m linhas
+'v w custo'), compartilhado pelos cenários 1 e 2.
+
+Cada cenário importa os módulos da própria pasta (como uteis.py), então
+este arquivo existe em Cenario1/ e em Cenario 2/ com o mesmo conteúdo:
+uma correção num deles deve ser copiada para o outro.
+
+As arestas são lidas direto para arrays tipados (NumPy int64 quando
+disponível, senão array('q')), sem montar uma lista Python por token.
+Além do texto puro, aceita:
+
+- o mesmo texto comprimido com gzip (detectado pelos bytes iniciais);
+- um formato binário compacto: b'ARES', n e m (uint32) e m registros
+  (v, w, custo) em int32 little-endian, gravado por salvar_arestas_binario.
+
+Linhas malformadas geram ValueError com o número da linha no arquivo.
+"""
+import gzip
+import io
+import struct
+import sys
+import warnings
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele usamos array('q').
+    np = None
+
+_MAGICO_GZIP = b'\x1f\x8b'
+_MAGICO_BINARIO = b'ARES'
+_CABECALHO_BINARIO = struct.Struct('<4sII')
+_REGISTRO_BINARIO = 12  # três int32
+# Arestas convertidas para inteiros Python por vez ao iterar arrays NumPy
+_BLOCO_ITERACAO = 65536
+
+
+class ListaDeArestas:
+    """
+    Arestas em arrays paralelos: origem[i] -> destino[i] com custo[i].
+    n é o número de vértices declarado no cabeçalho.
+    """
+
+    def __init__(self, n, origem, destino, custo):
+        self.n = n
+        self.origem, self.destino, self.custo = origem, destino, custo
+
+    @property
+    def m(self):
+        return len(self.origem)
+
+    def __len__(self):
+        return self.m
+
+    def __iter__(self):
+        """Tuplas (v, w, custo) com inteiros Python, sem copiar os arrays inteiros para listas."""
+        if np is not None and isinstance(self.origem, np.ndarray):
+            for i in range(0, self.m, _BLOCO_ITERACAO):
+                fatia = slice(i, i + _BLOCO_ITERACAO)
+                yield from zip(self.origem[fatia].tolist(), self.destino[fatia].tolist(),
+                               self.custo[fatia].tolist())
+        else:
+            # array('q'): cada elemento já sai como int, direto do buffer
+            yield from zip(self.origem, self.destino, self.custo)
+
+
+def _ler_bytes(caminho_arquivo):
+    with open(caminho_arquivo, 'rb') as f:
+        dados = f.read()
+    if dados[:2] == _MAGICO_GZIP:
+        dados = gzip.decompress(dados)
+    return dados
+
+
+def _ler_binario(dados):
+    if len(dados) < _CABECALHO_BINARIO.size:
+        raise ValueError("Arquivo binário de arestas sem cabeçalho completo.")
+    _, n, m = _CABECALHO_BINARIO.unpack_from(dados, 0)
+    tamanho = _CABECALHO_BINARIO.size + _REGISTRO_BINARIO * m
+    if len(dados) < tamanho:
+        raise ValueError(f"Arquivo binário truncado: esperados {m} trechos.")
+    corpo = memoryview(dados)[_CABECALHO_BINARIO.size:tamanho]
+
+    if np is not None:
+        registros = np.frombuffer(corpo, dtype='<i4').reshape(m, 3).astype(np.int64)
+        return ListaDeArestas(n, registros[:, 0].copy(), registros[:, 1].copy(), registros[:, 2].copy())
+
+    valores = array('i')
+    valores.frombytes(corpo)
+    if sys.byteorder == 'big':
+        valores.byteswap()
+    return ListaDeArestas(n, array('q', valores[0::3]), array('q', valores[1::3]), array('q', valores[2::3]))
+
+
+def _ler_corpo_python(corpo, m, primeira_linha):
+    """
+    Leitura linha a linha (corpo é um fluxo de bytes), que também localiza
+    a primeira linha inválida. Só a linha atual existe como objeto Python;
+    os valores vão direto para os arrays tipados.
+    """
+    origem, destino, custo = array('q'), array('q'), array('q')
+    for num_linha, linha in enumerate(corpo, start=primeira_linha):
+        if len(origem) == m:
+            break
+        partes = linha.split()
+        if not partes:
+            continue
+        try:
+            if len(partes) != 3:
+                raise ValueError
+            v, w, c = int(partes[0]), int(partes[1]), int(partes[2])
+        except ValueError:
+            raise ValueError(f"Linha {num_linha}: trecho malformado {linha.strip().decode(errors='replace')!r} "
+                             "(esperado 'v w custo').") from None
+        origem.append(v)
+        destino.append(w)
+        custo.append(c)
+    return origem, destino, custo
+
+
+def _ler_texto(dados):
+    fim_cabecalho = dados.find(b'\n')
+    if fim_cabecalho == -1:
+        fim_cabecalho = len(dados)
+    cabecalho = dados[:fim_cabecalho].split()
+    try:
+        if len(cabecalho) != 2:
+            raise ValueError
+        n, m = int(cabecalho[0]), int(cabecalho[1])
+    except ValueError:
+        raise ValueError("Linha 1: cabeçalho malformado (esperado 'n m').") from None
+    # Fluxo sobre os próprios bytes lidos, a partir da linha 2 (sem copiar o corpo)
+    corpo = io.BytesIO(dados)
+
+    tabela = None
+    if np is not None and m > 0:
+        try:
+            # Parser em C do NumPy: não cria objetos Python por token
+            with warnings.catch_warnings():
+                # Aviso sobre linhas em branco não contarem em max_rows (é o que queremos)
+                warnings.simplefilter('ignore', UserWarning)
+                corpo.seek(fim_cabecalho + 1)
+                tabela = np.loadtxt(corpo, dtype=np.int64, ndmin=2,
+                                    max_rows=m, comments=None)
+        except ValueError:
+            tabela = None
+        if tabela is not None and tabela.shape[1] != 3:
+            tabela = None
+
+    if tabela is not None:
+        origem, destino, custo = tabela[:, 0].copy(), tabela[:, 1].copy(), tabela[:, 2].copy()
+    else:
+        # Sem NumPy, ou para apontar a linha exata em que o NumPy falhou
+        corpo.seek(fim_cabecalho + 1)
+        origem, destino, custo = _ler_corpo_python(corpo, m, primeira_linha=2)
+        if np is not None:
+            origem, destino, custo = (np.asarray(origem, dtype=np.int64),
+                                      np.asarray(destino, dtype=np.int64),
+                                      np.asarray(custo, dtype=np.int64))
+
+    if len(origem) < m:
+        raise ValueError(f"O cabeçalho declara {m} trechos, mas o arquivo contém {len(origem)}.")
+    return ListaDeArestas(n, origem, destino, custo)
+
+
+def ler_arestas(caminho_arquivo):
+    """
+    Lê um arquivo de arestas (texto, texto gzip ou binário) e retorna uma
+    ListaDeArestas. Lança FileNotFoundError se o arquivo não existir e
+    ValueError, com o número da linha, para conteúdo malformado.
+    """
+    dados = _ler_bytes(caminho_arquivo)
+    if dados[:4] == _MAGICO_BINARIO:
+        return _ler_binario(dados)
+    return _ler_texto(dados)
+
+
+def salvar_arestas_binario(arestas, caminho_arquivo):
+    """Grava a ListaDeArestas no formato binário compacto lido por ler_arestas."""
+    if np is not None:
+        registros = np.stack([np.asarray(arestas.origem), np.asarray(arestas.destino),
+                              np.asarray(arestas.custo)], axis=1).astype('<i4').tobytes()
+    else:
+        valores = array('i')
+        for v, w, c in arestas:
+            valores.extend((v, w, c))
+        if sys.byteorder == 'big':
+            valores.byteswap()
+        registros = valores.tobytes()
+    with open(caminho_arquivo, 'wb') as f:
+        f.write(_CABECALHO_BINARIO.pack(_MAGICO_BINARIO, arestas.n, arestas.m))
+        f.write(registros)
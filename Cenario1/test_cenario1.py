@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from cache_distancias import caminho_cache
+from cenario1 import INFINITO, RedeDeMetro
+
+GRAFO_1 = os.path.join(os.path.dirname(__file__), 'graph1.txt')
+
+
+def _rede_linha():
+    rede = RedeDeMetro(3)
+    rede.adicionar_trecho(1, 2, 5)
+    rede.adicionar_trecho(2, 3, 7)
+    return rede
+
+
+def test_trecho_negativo_apos_floyd_warshall():
+    rede = _rede_linha()
+    rede.calcular_todas_rotas('floyd-warshall', backend='python')
+
+    with pytest.raises(ValueError):
+        rede.adicionar_trecho(1, 2, -1)
+
+    assert rede.adjacencia[0][1] == 5
+    assert [list(linha) for linha in rede.matriz_custos] == [[0, 5, 12], [5, 0, 7], [12, 7, 0]]
+    rede.adicionar_trecho(1, 3, 4)
+    assert rede.matriz_custos[1][2] == 7
+    assert rede.matriz_custos[0][2] == 4
+
+
+def test_trecho_negativo_com_matriz_do_cache(tmp_path):
+    arquivo = tmp_path / 'trechos.txt'
+    arquivo.write_text("3 2\n1 2 5\n2 3 7\n")
+    RedeDeMetro.carregar_com_cache(str(arquivo), str(tmp_path / 'cache'))
+    rede = RedeDeMetro.carregar_com_cache(str(arquivo), str(tmp_path / 'cache'))
+    assert rede.algoritmo_usado == 'cache'
+
+    with pytest.raises(ValueError):
+        rede.adicionar_trecho(2, 3, -2)
+
+    assert rede.matriz_custos[0][2] == 12
+    rede.remover_trecho(2, 3)
+    assert rede.matriz_custos[0][2] == INFINITO
+
+
+@pytest.mark.parametrize('backend', ['python', 'auto'])
+def test_rotas_apos_resolver_duas_vezes(backend):
+    rede = RedeDeMetro.carregar_de_arquivo(GRAFO_1)
+    rede.calcular_todas_rotas('floyd-warshall', backend=backend)
+    rede.calcular_todas_rotas('floyd-warshall', backend=backend, com_rotas=True)
+
+    nova = RedeDeMetro.carregar_de_arquivo(GRAFO_1)
+    nova.calcular_todas_rotas('floyd-warshall', backend=backend, com_rotas=True)
+    assert rede.rota(1, 12) == nova.rota(1, 12)
+    caminho = rede.rota(1, 12)
+    assert all(b - 1 in rede.adjacencia[a - 1] for a, b in zip(caminho, caminho[1:]))
+
+
+@pytest.mark.parametrize('conteudo', [b'', b'FWD1', b'FWD0' + bytes(8), b'FWD1\x03\x00\x00\x00\xff\xff\xff\x7f' + bytes(8)])
+def test_cache_invalido_e_recalculado(tmp_path, conteudo):
+    arquivo = tmp_path / 'trechos.txt'
+    arquivo.write_text("3 2\n1 2 5\n2 3 7\n")
+    caminho = caminho_cache(str(arquivo), str(tmp_path / 'cache'))
+    os.makedirs(os.path.dirname(caminho))
+    with open(caminho, 'wb') as f:
+        f.write(conteudo)
+
+    rede = RedeDeMetro.carregar_com_cache(str(arquivo), str(tmp_path / 'cache'))
+    assert rede.algoritmo_usado != 'cache'
+    assert rede.matriz_custos[0][2] == 12
+    rede = RedeDeMetro.carregar_com_cache(str(arquivo), str(tmp_path / 'cache'))
+    assert rede.algoritmo_usado == 'cache'
+    assert rede.matriz_custos[0][2] == 12
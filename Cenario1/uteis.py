@@ -1,10 +1,57 @@
 import sys
+from array import array
 from typing import Generator
 from abc import ABC, abstractmethod
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele usamos os laços em Python puro.
+    np = None
+
 # Usamos um valor alto para representar a ausência de conexão (infinito).
 INFINITO = float('inf')
 
+
+def resolver_backend(backend: str = 'auto') -> str:
+    """
+    Traduz o backend pedido ('auto', 'numpy' ou 'python') no backend efetivo.
+    'auto' usa NumPy quando disponível e cai para Python puro caso contrário.
+    """
+    if backend == 'auto':
+        return 'numpy' if np is not None else 'python'
+    if backend == 'numpy' and np is None:
+        raise ImportError("O backend 'numpy' requer o pacote NumPy instalado.")
+    if backend not in ('numpy', 'python'):
+        raise ValueError(f"Backend desconhecido: '{backend}'. Use 'auto', 'numpy' ou 'python'.")
+    return backend
+
+
+def floyd_warshall_numpy(D, proximo=None):
+    """
+    Floyd-Warshall vetorizado sobre um array 2-D do NumPy, alterado no lugar.
+    Cada passo k é um único 'min' da matriz inteira com D[:, k] + D[k, :]
+    (broadcast), em vez dos dois laços internos em Python.
+
+    Se 'proximo' (matriz de próximos saltos, inteira) for passada, ela é
+    atualizada no mesmo passo: proximo[i][j] <- proximo[i][k] onde houve
+    melhora, como a matriz de roteamento do pseudocódigo.
+    """
+    n = D.shape[0]
+    via_k = np.empty_like(D)
+    if proximo is None:
+        for k in range(n):
+            np.add(D[:, k, None], D[None, k, :], out=via_k)
+            np.minimum(D, via_k, out=D)
+        return D
+
+    melhora = np.empty(D.shape, dtype=bool)
+    for k in range(n):
+        np.add(D[:, k, None], D[None, k, :], out=via_k)
+        np.less(via_k, D, out=melhora)
+        np.copyto(D, via_k, where=melhora)
+        np.copyto(proximo, proximo[:, k, None], where=melhora)
+    return D
+
 class GraphBase(ABC):
     # ... (O código da classe GraphBase permanece inalterado)
     def __init__(self, n: int, directed: bool = False) -> None:
@@ -57,12 +104,23 @@ class GraphAdjMatrix(GraphBase):
         self.M[w][v] = INFINITO
 
     # --- IMPLEMENTAÇÃO FLOYD-WARSHALL ---
-    def floyd_warshall(self):
+    def floyd_warshall(self, backend: str = 'auto'):
       """
       Executa o algoritmo de Floyd-Warshall para encontrar os caminhos
       mínimos entre todos os pares de vértices na matriz M.
       O resultado é armazenado na própria matriz M.
+
+      Com backend 'numpy' (padrão quando disponível) M passa a ser um
+      array 2-D contíguo de float64; com 'python' usa os laços originais.
       """
+      if resolver_backend(backend) == 'numpy':
+        M = np.array(self.M, dtype=np.float64)
+        # A linha/coluna 0 não é usada (vértices indexados de 1 a N)
+        sub = np.ascontiguousarray(M[1:, 1:])
+        M[1:, 1:] = floyd_warshall_numpy(sub)
+        self.M = M
+        return self.M
+
       N = self.n
       
       # Os laços vão de 1 a N, pois os vértices são indexados de 1 a N
@@ -85,6 +143,179 @@ class GraphAdjMatrix(GraphBase):
       # Você pode retornar ou simplesmente deixá-la como um estado da classe.
       return self.M
 
+# ----------------------------------------------------------------------
+# CLASSE GraphCSR (LINHAS ESPARSAS COMPRIMIDAS)
+# ----------------------------------------------------------------------
+
+class GraphCSR(GraphBase):
+    """
+    Grafo no formato CSR (compressed sparse row).
+
+    Os vizinhos de saída de v são targets[offsets[v]:offsets[v+1]], com os
+    custos correspondentes em weights: iterar os vizinhos custa O(grau(v)) e
+    a memória é O(n + m), em vez das (n+1)² células da GraphAdjMatrix. Há
+    linhas para os vértices 0..n (como na GraphAdjMatrix, a posição 0 fica
+    livre). Arestas não-direcionadas são guardadas nos dois sentidos.
+
+    A estrutura é montada em lote (fromArrays, fromAdjMatrix); addEdge e
+    removeEdge reconstroem os arrays em O(n + m).
+    """
+    def __init__(self, n: int, directed: bool = False, edges = ()) -> None:
+      """ Monta o grafo a partir de tuplas (v, w) ou (v, w, peso). """
+      super().__init__(n, directed)
+      sources, targets, weights = [], [], []
+      for edge in edges:
+        sources.append(edge[0])
+        targets.append(edge[1])
+        weights.append(edge[2] if len(edge) > 2 else 1)
+      self._build(sources, targets, weights)
+
+    @classmethod
+    def fromArrays(cls, n: int, sources, targets, weights = None, directed: bool = False) -> "GraphCSR":
+      """
+      Monta o grafo a partir de arrays paralelos (listas, array.array ou
+      NumPy): a aresta i vai de sources[i] a targets[i] com custo weights[i]
+      (1 se weights for omitido).
+      """
+      graph = cls.__new__(cls)
+      GraphBase.__init__(graph, n, directed)
+      sources, targets = _asList(sources), _asList(targets)
+      weights = [1] * len(sources) if weights is None else _asList(weights)
+      graph._build(sources, targets, weights)
+      return graph
+
+    @classmethod
+    def fromAdjMatrix(cls, graph: "GraphAdjMatrix") -> "GraphCSR":
+      """ Converte uma GraphAdjMatrix (células INFINITO = sem aresta). """
+      sources, targets, weights = [], [], []
+      for v, row in enumerate(graph.M):
+        for w, value in enumerate(row):
+          if v == w or value == INFINITO:
+            continue
+          if not graph.directed and w < v:
+            continue
+          sources.append(v)
+          targets.append(w)
+          weights.append(value)
+      return cls.fromArrays(graph.n, sources, targets, weights, graph.directed)
+
+    def toAdjMatrix(self) -> "GraphAdjMatrix":
+      """ Converte de volta para uma GraphAdjMatrix com os mesmos custos. """
+      graph = GraphAdjMatrix(self.n, self.directed)
+      for v, w, weight in self.edgesWithWeights():
+        graph.addEdge(v, w, weight)
+      return graph
+
+    def _build(self, sources, targets, weights):
+      rows = self.n + 1
+      arcs = 0
+      count = array('q', bytes(8 * (rows + 1)))
+      for v, w in zip(sources, targets):
+        count[v + 1] += 1
+        arcs += 1
+        if not self.directed and v != w:
+          count[w + 1] += 1
+          arcs += 1
+      for v in range(rows):
+        count[v + 1] += count[v]
+
+      code = 'q' if all(isinstance(c, int) for c in weights) else 'd'
+      self.offsets = count
+      self.targets = array('q', bytes(8 * arcs))
+      self.weights = array(code, bytes(8 * arcs))
+      position = array('q', count[:rows])
+      for v, w, c in zip(sources, targets, weights):
+        p = position[v]
+        self.targets[p], self.weights[p] = w, c
+        position[v] = p + 1
+        if not self.directed and v != w:
+          p = position[w]
+          self.targets[p], self.weights[p] = v, c
+          position[w] = p + 1
+      self.m = len(sources)
+      self._reverse = None
+
+    def _inNeighbors(self, v: int):
+      if self._reverse is None:
+        sources = array('q')
+        for u in range(self.n + 1):
+          sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+        self._reverse = GraphCSR.fromArrays(self.n, self.targets, sources, self.weights, directed = True)
+      return self._reverse.getNeighbors(v, mode = "+")
+
+    def getNeighbors(self, v: int, mode: str = "*", closed: bool = False) -> Generator[int, None, None]:
+      """
+      Vizinhos de v em O(grau(v)). Em grafos direcionados, mode "+" dá os
+      vizinhos de saída, "-" os de entrada e "*" ambos; closed=True inclui v.
+      """
+      if closed:
+        yield v
+      if self.directed and mode == "-":
+        yield from self._inNeighbors(v)
+      elif self.directed and mode == "*":
+        seen = set()
+        for w in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+          seen.add(w)
+          yield w
+        for w in self._inNeighbors(v):
+          if w not in seen:
+            yield w
+      else:
+        yield from self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def getWeightedNeighbors(self, v: int) -> Generator[tuple[int, float], None, None]:
+      """ Pares (w, peso) de cada vizinho de saída w de v, em O(grau(v)). """
+      start, end = self.offsets[v], self.offsets[v + 1]
+      yield from zip(self.targets[start:end], self.weights[start:end])
+
+    def isNeighbor(self, v: int, w: int) -> bool:
+      return w in self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def E(self) -> Generator[tuple[int, int], None, None]:
+      """ Retorna a lista de arestas vw """
+      for v, w, _ in self.edgesWithWeights():
+        yield (v, w)
+
+    def edgesWithWeights(self) -> Generator[tuple[int, int, float], None, None]:
+      """ Cada aresta uma vez, como (v, w, peso); não-direcionadas com v <= w. """
+      for v in range(self.n + 1):
+        for p in range(self.offsets[v], self.offsets[v + 1]):
+          w = self.targets[p]
+          if self.directed or v <= w:
+            yield (v, w, self.weights[p])
+
+    def addEdge(self, v: int, w: int, weight: int = 1):
+      """ Adiciona a aresta vw (reconstrói os arrays, O(n + m)). """
+      sources, targets, weights = self._edgeLists()
+      sources.append(v)
+      targets.append(w)
+      weights.append(weight)
+      self._build(sources, targets, weights)
+
+    def removeEdge(self, v: int, w: int):
+      """ Remove a aresta vw (reconstrói os arrays, O(n + m)). """
+      sources, targets, weights = [], [], []
+      for a, b, c in self.edgesWithWeights():
+        if (a, b) == (v, w) or (not self.directed and (a, b) == (w, v)):
+          continue
+        sources.append(a)
+        targets.append(b)
+        weights.append(c)
+      self._build(sources, targets, weights)
+
+    def _edgeLists(self):
+      sources, targets, weights = [], [], []
+      for v, w, c in self.edgesWithWeights():
+        sources.append(v)
+        targets.append(w)
+        weights.append(c)
+      return sources, targets, weights
+
+
+def _asList(values):
+    """ Valores Python puros a partir de lista, array.array ou array NumPy. """
+    return values.tolist() if hasattr(values, 'tolist') else list(values)
+
 # --- Exemplo de Uso ---
 if __name__ == "__main__":
     # Grafo não-direcionado com 4 vértices
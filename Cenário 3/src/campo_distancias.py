@@ -0,0 +1,141 @@
+"""
+Campo de distâncias reverso a partir de um objetivo G.
+
+Um único Dijkstra reverso a partir de G (pelas arestas de entrada do
+grafo, getInNeighbors) dá o custo de cada célula até G e, para cada
+célula, o próximo passo em direção a G. Com o campo pronto, qualquer
+robô que vá para o mesmo G tem o custo em O(1) e o caminho em
+O(comprimento do caminho), sem nova busca.
+
+CacheDeCampos guarda os campos por (hash do grid, objetivo) com política
+LRU. Em obter_do_arquivo, uma mudança no arquivo do grid (data de
+modificação ou tamanho) faz o grid ser relido e descarta os campos do
+conteúdo antigo.
+"""
+import math
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from cen3 import PESO_MAXIMO, GridToGraphConverter, ler_grid_do_arquivo
+from fronteiras import criar_fronteira
+from hierarquico import hash_grid
+
+TAMANHO_CACHE_PADRAO = 8
+
+Coordenada = Tuple[int, int]
+
+
+class CampoDeDistancias:
+    """
+    Custos até o objetivo e próximos passos, indexados 1-based como no
+    Dijkstra: d[v] é o custo de v até G e posterior[v] o vértice seguinte.
+    """
+
+    def __init__(self, converter: GridToGraphConverter, objetivo: Coordenada, fronteira: str = 'heap'):
+        self.converter = converter
+        self.objetivo = tuple(objetivo)
+        n = converter.graph.n
+        self.d = [math.inf] * (n + 1)
+        self.posterior: List[Optional[int]] = [None] * (n + 1)
+
+        destino = converter.coord_to_index(self.objetivo) + 1
+        self.d[destino] = 0
+        abertos = criar_fronteira(fronteira, PESO_MAXIMO)
+        abertos.inserir(destino, 0)
+        fechado = [False] * (n + 1)
+        while True:
+            minimo = abertos.extrair_minimo()
+            if minimo is None:
+                break
+            r, d_r = minimo
+            fechado[r] = True
+            for l, custo in converter.graph.getInNeighbors(r):
+                if fechado[l]:
+                    continue
+                nova_soma = d_r + custo
+                if nova_soma < self.d[l]:
+                    self.d[l] = nova_soma
+                    self.posterior[l] = r
+                    abertos.inserir(l, nova_soma)
+
+    def custo(self, inicio: Coordenada) -> float:
+        """Custo mínimo de inicio até o objetivo (inf se inalcançável)."""
+        return self.d[self.converter.coord_to_index(inicio) + 1]
+
+    def caminho(self, inicio: Coordenada) -> List[Coordenada]:
+        """
+        Caminho de inicio até o objetivo, seguindo os próximos passos, no
+        formato de Dijkstra.reconstruir_caminho ([] se inalcançável).
+        """
+        v = self.converter.coord_to_index(inicio) + 1
+        if self.d[v] == math.inf:
+            return []
+        caminho = []
+        while v is not None:
+            caminho.append(self.converter.index_to_coord(v - 1))
+            v = self.posterior[v]
+        return caminho
+
+
+class CacheDeCampos:
+    """Cache LRU de campos de distâncias por (hash do grid, objetivo)."""
+
+    def __init__(self, capacidade: int = TAMANHO_CACHE_PADRAO):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self.capacidade = capacidade
+        self._campos: 'OrderedDict[Tuple[str, Coordenada], CampoDeDistancias]' = OrderedDict()
+        # nome do arquivo -> (mtime_ns, tamanho, converter, hash do grid)
+        self._arquivos: Dict[str, Tuple[int, int, GridToGraphConverter, str]] = {}
+        self.acertos = 0
+        self.faltas = 0
+
+    def __len__(self) -> int:
+        return len(self._campos)
+
+    def obter(self, converter: GridToGraphConverter, objetivo: Optional[Coordenada] = None,
+              chave_grid: Optional[str] = None) -> CampoDeDistancias:
+        """
+        Campo do objetivo (padrão: o 'G' do converter) sobre o grid do
+        converter. chave_grid evita recalcular o hash do grid quando o
+        chamador já o conhece.
+        """
+        if objetivo is None:
+            objetivo = converter.goal_coord
+            if objetivo is None:
+                raise ValueError("O grid não tem um objetivo ('G'); informe o objetivo.")
+        objetivo = tuple(objetivo)
+        chave = (chave_grid or hash_grid(converter.grid), objetivo)
+        campo = self._campos.get(chave)
+        if campo is not None:
+            self._campos.move_to_end(chave)
+            self.acertos += 1
+            return campo
+        self.faltas += 1
+        campo = CampoDeDistancias(converter, objetivo)
+        self._campos[chave] = campo
+        if len(self._campos) > self.capacidade:
+            self._campos.popitem(last=False)
+        return campo
+
+    def obter_do_arquivo(self, nome_arquivo: str, objetivo: Optional[Coordenada] = None) -> CampoDeDistancias:
+        """
+        Como obter, para o grid lido de nome_arquivo. O arquivo só é relido
+        quando muda; nesse caso os campos do grid antigo são descartados.
+        """
+        estado = os.stat(nome_arquivo)
+        registro = self._arquivos.get(nome_arquivo)
+        if registro is None or registro[:2] != (estado.st_mtime_ns, estado.st_size):
+            if registro is not None:
+                self.invalidar(registro[3])
+            num_linhas, num_colunas, grid = ler_grid_do_arquivo(nome_arquivo)
+            converter = GridToGraphConverter(num_linhas, num_colunas, grid, exigir_pontos=False)
+            registro = (estado.st_mtime_ns, estado.st_size, converter, hash_grid(grid))
+            self._arquivos[nome_arquivo] = registro
+        return self.obter(registro[2], objetivo, chave_grid=registro[3])
+
+    def invalidar(self, chave_grid: str):
+        """Descarta todos os campos calculados sobre o grid com este hash."""
+        for chave in [chave for chave in self._campos if chave[0] == chave_grid]:
+            del self._campos[chave]
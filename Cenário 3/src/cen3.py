@@ -1,8 +1,10 @@
 import math
+import mmap
 import os
 # Importando as classes base fornecidas
 from uteis import GraphBase, GraphAdjMatrix 
-from typing import List, Tuple, Dict, Set, Optional, Generator
+from fronteiras import criar_fronteira
+from typing import List, Tuple, Dict, Set, Optional, Generator, Union
 
 # --- 1. CONFIGURAÇÃO DE CUSTOS E LEITURA ---
 
@@ -42,6 +44,165 @@ def ler_grid_do_arquivo(nome_arquivo: str) -> Tuple[int, int, List[List[str]]]:
 
     return num_linhas, num_colunas, grid
 
+# Custo de *entrar* em cada caractere: 'S' e 'G' custam como piso livre
+CUSTO_CARACTERE = dict(CUSTOS, S=CUSTOS['.'], G=CUSTOS['.'])
+# Menor e maior custo de um movimento (heurísticas e filas de baldes)
+CUSTO_MINIMO = min(CUSTO_CARACTERE.values())
+PESO_MAXIMO = max(custo for custo in CUSTO_CARACTERE.values() if custo != math.inf)
+
+def montar_tabela_custos() -> List[float]:
+    """
+    Tabela de 256 posições, indexada pelo byte da célula, com o custo de
+    entrar nela (derivada de CUSTO_CARACTERE; bytes desconhecidos são
+    intransponíveis).
+    """
+    tabela = [math.inf] * 256
+    for caractere, custo in CUSTO_CARACTERE.items():
+        tabela[ord(caractere)] = custo
+    return tabela
+
+TABELA_CUSTOS = montar_tabela_custos()
+
+class LinhaCompacta:
+    """Visão de uma linha do GridCompacto: linha[c] lê e escreve o caractere direto no buffer."""
+
+    def __init__(self, dados, inicio: int, num_colunas: int):
+        self.dados, self.inicio, self.num_colunas = dados, inicio, num_colunas
+
+    def __len__(self) -> int:
+        return self.num_colunas
+
+    def __getitem__(self, c: int) -> str:
+        if not 0 <= c < self.num_colunas:
+            raise IndexError(c)
+        return chr(self.dados[self.inicio + c])
+
+    def __setitem__(self, c: int, caractere: str):
+        if not 0 <= c < self.num_colunas:
+            raise IndexError(c)
+        self.dados[self.inicio + c] = ord(caractere)
+
+    def __iter__(self):
+        return iter(bytes(self.dados[self.inicio:self.inicio + self.num_colunas]).decode('latin-1'))
+
+class GridCompacto:
+    """
+    Grid guardado num único buffer de bytes (bytearray ou mmap), um byte
+    por célula, com linhas de largura fixa: a célula (r, c) fica em
+    inicio + r * passo + c. O custo de cada célula sai de TABELA_CUSTOS.
+
+    grid[r][c] continua funcionando (ver LinhaCompacta), então o grid
+    compacto pode ser usado onde se espera a lista de listas.
+    """
+
+    def __init__(self, dados, num_linhas: int, num_colunas: int, inicio: int = 0, passo: Optional[int] = None):
+        self.dados = dados
+        self.num_linhas, self.num_colunas = num_linhas, num_colunas
+        self.inicio = inicio
+        self.passo = num_colunas if passo is None else passo
+        # Tamanho exato; só o terminador da última linha pode faltar
+        tamanho = inicio + num_linhas * self.passo
+        if len(dados) not in (tamanho, tamanho - (self.passo - num_colunas)):
+            raise ValueError(f"O buffer não contém exatamente as {num_linhas} linhas de {num_colunas} células declaradas.")
+
+    @classmethod
+    def de_linhas(cls, num_linhas: int, num_colunas: int, grid: List[List[str]]) -> 'GridCompacto':
+        """Copia um grid de listas de caracteres para um bytearray compacto."""
+        dados = bytearray(num_linhas * num_colunas)
+        for r, linha in enumerate(grid):
+            dados[r * num_colunas:(r + 1) * num_colunas] = ''.join(linha).encode('latin-1')
+        return cls(dados, num_linhas, num_colunas)
+
+    def __len__(self) -> int:
+        return self.num_linhas
+
+    def __getitem__(self, r: int) -> LinhaCompacta:
+        if not 0 <= r < self.num_linhas:
+            raise IndexError(r)
+        return LinhaCompacta(self.dados, self.inicio + r * self.passo, self.num_colunas)
+
+    def __iter__(self):
+        for r in range(self.num_linhas):
+            yield self[r]
+
+    def posicao(self, r: int, c: int) -> int:
+        """Deslocamento da célula (r, c) no buffer."""
+        return self.inicio + r * self.passo + c
+
+    def custo(self, r: int, c: int) -> float:
+        """Custo de entrar na célula (r, c)."""
+        return TABELA_CUSTOS[self.dados[self.inicio + r * self.passo + c]]
+
+    def criar_grafo(self) -> 'CompactGridGraph':
+        """Grafo implícito que lê este buffer direto (usado por GridToGraphConverter)."""
+        return CompactGridGraph(self.num_linhas, self.num_colunas, self)
+
+    def encontrar_todos(self, caractere: str) -> List[Tuple[int, int]]:
+        """Coordenadas de todas as ocorrências de caractere, em ordem (busca em C no buffer)."""
+        alvo = caractere.encode('latin-1')
+        coordenadas = []
+        posicao = self.dados.find(alvo, self.inicio)
+        while posicao != -1:
+            r, c = divmod(posicao - self.inicio, self.passo)
+            if r >= self.num_linhas:
+                break
+            if c < self.num_colunas:
+                coordenadas.append((r, c))
+            posicao = self.dados.find(alvo, posicao + 1)
+        return coordenadas
+
+def abrir_grid_mapeado(nome_arquivo: str) -> Tuple[int, int, GridCompacto]:
+    """
+    Abre o arquivo do grid com mmap, sem ler as linhas: só o cabeçalho e a
+    primeira linha são examinados para achar a largura fixa das linhas
+    (com terminador '\n' ou '\r\n') e o tamanho do arquivo é conferido
+    contra essa largura, então o tempo não depende do tamanho do mapa. O
+    mapeamento é copy-on-write: alterações no grid ficam na memória e
+    nunca são gravadas no arquivo.
+
+    Exige o formato estrito de grid_example.txt: cabeçalho 'i j' na
+    primeira linha e as i linhas seguintes com exatamente j caracteres.
+    """
+    with open(nome_arquivo, 'rb') as f:
+        dados = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    fim_cabecalho = dados.find(b'\n')
+    try:
+        if fim_cabecalho == -1:
+            raise ValueError
+        num_linhas, num_colunas = map(int, dados[:fim_cabecalho].split())
+    except ValueError:
+        dados.close()
+        raise ValueError(f"'{nome_arquivo}': cabeçalho 'i j' não encontrado.") from None
+    inicio = fim_cabecalho + 1
+    fim_primeira = dados.find(b'\n', inicio)
+    terminador = 1
+    if fim_primeira == -1:
+        fim_primeira, terminador = len(dados), 0
+    elif dados[fim_primeira - 1] == ord('\r'):
+        fim_primeira, terminador = fim_primeira - 1, 2
+    if fim_primeira - inicio != num_colunas:
+        dados.close()
+        raise ValueError(f"'{nome_arquivo}': a primeira linha do grid não tem {num_colunas} células.")
+    # Uma linha mais curta ou mais longa deslocaria todas as seguintes: o
+    # tamanho tem de ser exato e os terminadores em volta da última linha
+    # têm de estar no lugar (só o da última linha pode faltar)
+    separador = dados[fim_primeira:fim_primeira + terminador]
+    passo = num_colunas + terminador
+    fim_penultima = inicio + (num_linhas - 1) * passo
+    try:
+        grid = GridCompacto(dados, num_linhas, num_colunas, inicio, passo)
+        valido = num_linhas < 2 or dados[fim_penultima - terminador:fim_penultima] == separador
+        if len(dados) == inicio + num_linhas * passo:
+            valido = valido and dados[len(dados) - terminador:] == separador
+        else:
+            valido = valido and dados[-1:] not in (b'\r', b'\n')
+    except ValueError:
+        valido = False
+    if not valido:
+        dados.close()
+        raise ValueError(f"'{nome_arquivo}': o grid não tem {num_linhas} linhas de {num_colunas} células.")
+    return num_linhas, num_colunas, grid
+
 # --- 2. EXTENSÃO DA CLASSE DE GRAFO PARA SUPORTE A PESOS ---
 
 class WeightedGridGraph(GraphAdjMatrix):
@@ -72,37 +233,209 @@ class WeightedGridGraph(GraphAdjMatrix):
                 yield (w, weight)
             w += 1
 
+    def getInNeighbors(self, v: int) -> Generator[Tuple[int, float], None, None]:
+        """Retorna os vértices com aresta para v e o custo dessa aresta (busca reversa)."""
+        u = 1
+        while u <= self.n:
+            weight = self.M[u][v]
+            if weight > 0 and weight != math.inf:
+                yield (u, weight)
+            u += 1
+
+class ImplicitGridGraph(GraphBase):
+    """
+    Grafo do grid sem matriz de adjacência: os vizinhos (4 direções) e o
+    custo de entrar em cada um são calculados na hora a partir do próprio
+    grid. Memória O(1) por célula (só o grid) e O(1) por vizinho, com a
+    mesma interface usada pelo Dijkstra (n e getNeighbors, 1-based).
+
+    O grafo é somente leitura: addEdge e removeEdge lançam TypeError, e as
+    arestas mudam alterando o próprio grid.
+    """
+
+    def __init__(self, num_linhas: int, num_colunas: int, grid: List[List[str]]):
+        # Sem GraphBase.__init__: m é calculado sob demanda (ver a propriedade m)
+        self.n, self.directed = num_linhas * num_colunas, True
+        self.num_linhas = num_linhas
+        self.num_colunas = num_colunas
+        self.grid = grid
+        self.custo_caractere = CUSTO_CARACTERE
+        self._m: Optional[int] = None
+
+    @property
+    def m(self) -> int:
+        """Número de arestas, contado na primeira consulta (percorre o grid inteiro)."""
+        if self._m is None:
+            self._m = sum(1 for v in range(1, self.n + 1) for _ in self.getNeighbors(v))
+        return self._m
+
+    def addEdge(self, v: int, w: int):
+        raise TypeError("As arestas do grafo implícito vêm do grid; altere o grid.")
+
+    def removeEdge(self, v: int, w: int):
+        raise TypeError("As arestas do grafo implícito vêm do grid; altere o grid.")
+
+    def getNeighbors(self, v: int) -> Generator[Tuple[int, float], None, None]:
+        """Retorna vizinhos de v e o custo do movimento (peso), em ordem crescente de índice."""
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        grid = self.grid
+        if grid[r][c] == '#':
+            return
+        custo = self.custo_caractere
+        # N, O, L, S: mesma ordem crescente de índice do WeightedGridGraph
+        if r > 0:
+            peso = custo.get(grid[r - 1][c], math.inf)
+            if peso != math.inf:
+                yield (v - num_colunas, peso)
+        if c > 0:
+            peso = custo.get(grid[r][c - 1], math.inf)
+            if peso != math.inf:
+                yield (v - 1, peso)
+        if c + 1 < num_colunas:
+            peso = custo.get(grid[r][c + 1], math.inf)
+            if peso != math.inf:
+                yield (v + 1, peso)
+        if r + 1 < self.num_linhas:
+            peso = custo.get(grid[r + 1][c], math.inf)
+            if peso != math.inf:
+                yield (v + num_colunas, peso)
+
+    def getInNeighbors(self, v: int) -> Generator[Tuple[int, float], None, None]:
+        """Retorna os vértices com aresta para v e o custo dessa aresta (busca reversa)."""
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        grid = self.grid
+        # Toda aresta que chega em v custa o mesmo: o custo de entrar em v
+        peso = self.custo_caractere.get(grid[r][c], math.inf)
+        if peso == math.inf:
+            return
+        if r > 0 and grid[r - 1][c] != '#':
+            yield (v - num_colunas, peso)
+        if c > 0 and grid[r][c - 1] != '#':
+            yield (v - 1, peso)
+        if c + 1 < num_colunas and grid[r][c + 1] != '#':
+            yield (v + 1, peso)
+        if r + 1 < self.num_linhas and grid[r + 1][c] != '#':
+            yield (v + num_colunas, peso)
+
+class CompactGridGraph(ImplicitGridGraph):
+    """
+    ImplicitGridGraph sobre um GridCompacto: os vizinhos são lidos direto
+    do buffer de bytes e o custo vem de TABELA_CUSTOS, sem criar strings.
+    """
+
+    def getNeighbors(self, v: int) -> Generator[Tuple[int, float], None, None]:
+        """Retorna vizinhos de v e o custo do movimento (peso), em ordem crescente de índice."""
+        grid = self.grid
+        dados, passo, tabela = grid.dados, grid.passo, TABELA_CUSTOS
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        p = grid.inicio + r * passo + c
+        if dados[p] == 35:  # '#'
+            return
+        if r > 0:
+            peso = tabela[dados[p - passo]]
+            if peso != math.inf:
+                yield (v - num_colunas, peso)
+        if c > 0:
+            peso = tabela[dados[p - 1]]
+            if peso != math.inf:
+                yield (v - 1, peso)
+        if c + 1 < num_colunas:
+            peso = tabela[dados[p + 1]]
+            if peso != math.inf:
+                yield (v + 1, peso)
+        if r + 1 < self.num_linhas:
+            peso = tabela[dados[p + passo]]
+            if peso != math.inf:
+                yield (v + num_colunas, peso)
+
+    def getInNeighbors(self, v: int) -> Generator[Tuple[int, float], None, None]:
+        """Retorna os vértices com aresta para v e o custo dessa aresta (busca reversa)."""
+        grid = self.grid
+        dados, passo = grid.dados, grid.passo
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        p = grid.inicio + r * passo + c
+        peso = TABELA_CUSTOS[dados[p]]
+        if peso == math.inf:
+            return
+        if r > 0 and dados[p - passo] != 35:
+            yield (v - num_colunas, peso)
+        if c > 0 and dados[p - 1] != 35:
+            yield (v - 1, peso)
+        if c + 1 < num_colunas and dados[p + 1] != 35:
+            yield (v + 1, peso)
+        if r + 1 < self.num_linhas and dados[p + passo] != 35:
+            yield (v + num_colunas, peso)
+
 # --- 3. CONVERSOR DO GRID PARA GRAFO E MAPEAMENTO DE ÍNDICES ---
 
 class GridToGraphConverter:
     """Converte o grid de caracteres em um objeto WeightedGridGraph."""
 
-    def __init__(self, num_linhas: int, num_colunas: int, grid: List[List[str]]):
+    def __init__(self, num_linhas: int, num_colunas: int, grid: List[List[str]], implicito: bool = True,
+                 exigir_pontos: bool = True):
+        """
+        Com implicito=True (padrão) o grafo é um ImplicitGridGraph, que lê
+        os vizinhos direto do grid; com implicito=False é montada a matriz
+        de adjacência (n+1)² do WeightedGridGraph. Com exigir_pontos=False
+        o grid pode não ter 'S' e 'G' (os pontos são dados depois, por
+        definir_pontos).
+        """
+        self.exigir_pontos = exigir_pontos
         self.num_linhas = num_linhas
         self.num_colunas = num_colunas
         self.grid = grid
         self.tamanho_V = num_linhas * num_colunas
         self.start_coord: Optional[Tuple[int, int]] = None
         self.goal_coord: Optional[Tuple[int, int]] = None
-        
-        # O grafo WeightedGridGraph usará indexação 1-based (1 a N)
-        self.graph = WeightedGridGraph(self.tamanho_V, directed=True) # Usamos direcionado para maior flexibilidade
+        # Todos os 'S' e 'G' do grid, em ordem de leitura (start_coord e goal_coord são os últimos)
+        self.start_coords: List[Tuple[int, int]] = []
+        self.goal_coords: List[Tuple[int, int]] = []
         
         self._encontrar_pontos()
-        self._construir_arestas()
+
+        # Os dois grafos usam indexação 1-based (1 a N)
+        if implicito and hasattr(grid, 'criar_grafo'):
+            # Grids em buffer (GridCompacto, GridLadrilhado) escolhem o próprio grafo implícito
+            self.graph = grid.criar_grafo()
+        elif implicito:
+            self.graph = ImplicitGridGraph(num_linhas, num_colunas, grid)
+        else:
+            self.graph = WeightedGridGraph(self.tamanho_V, directed=True) # Usamos direcionado para maior flexibilidade
+            self._construir_arestas()
 
     def _encontrar_pontos(self):
-        """Encontra as coordenadas de S e G."""
-        for r in range(self.num_linhas):
-            for c in range(self.num_colunas):
-                if self.grid[r][c] == 'S':
-                    self.start_coord = (r, c)
-                elif self.grid[r][c] == 'G':
-                    self.goal_coord = (r, c)
+        """Encontra as coordenadas de todos os S e G."""
+        if hasattr(self.grid, 'encontrar_todos'):
+            # Busca no buffer, sem percorrer as células em Python
+            self.start_coords = self.grid.encontrar_todos('S')
+            self.goal_coords = self.grid.encontrar_todos('G')
+        else:
+            for r in range(self.num_linhas):
+                for c in range(self.num_colunas):
+                    if self.grid[r][c] == 'S':
+                        self.start_coords.append((r, c))
+                    elif self.grid[r][c] == 'G':
+                        self.goal_coords.append((r, c))
+        if self.start_coords:
+            self.start_coord = self.start_coords[-1]
+        if self.goal_coords:
+            self.goal_coord = self.goal_coords[-1]
         
-        if self.start_coord is None or self.goal_coord is None:
+        if self.exigir_pontos and (self.start_coord is None or self.goal_coord is None):
             raise ValueError("O grid deve conter um ponto de Início ('S') e um Objetivo ('G').")
     
+    def definir_pontos(self, start_coord: Tuple[int, int], goal_coord: Tuple[int, int]):
+        """Troca os pontos de início e objetivo sem reconstruir o grafo."""
+        for r, c in (start_coord, goal_coord):
+            if not (0 <= r < self.num_linhas and 0 <= c < self.num_colunas):
+                raise ValueError(f"A coordenada {(r, c)} está fora do grid.")
+        self.start_coord, self.goal_coord = tuple(start_coord), tuple(goal_coord)
+        self.start_coords, self.goal_coords = [self.start_coord], [self.goal_coord]
+
     def get_start_node(self) -> int:
         """Retorna o índice 1-based do nó inicial."""
         # Mapeia 0-based para 1-based
@@ -128,6 +461,9 @@ class GridToGraphConverter:
         """Retorna o custo de *entrar* em uma célula."""
         r, c = coord
         if 0 <= r < self.num_linhas and 0 <= c < self.num_colunas:
+            if hasattr(self.grid, 'custo'):
+                return self.grid.custo(r, c)
+
             caractere = self.grid[r][c]
             
             # O custo de movimento para 'S' ou 'G' é o do piso livre ('.'), que é 1.
@@ -169,25 +505,55 @@ class GridToGraphConverter:
                             
 # --- 4. IMPLEMENTAÇÃO DO DIJKSTRA (1-based) ---
 
+class VetorEsparso(dict):
+    """Dicionário que responde 'padrao' para índices nunca escritos, no lugar de uma lista de tamanho N+1."""
+
+    def __init__(self, padrao):
+        super().__init__()
+        self.padrao = padrao
+
+    def __missing__(self, chave):
+        return self.padrao
+
 class Dijkstra:
-    """Implementação do Algoritmo de Dijkstra, utilizando o WeightedGridGraph e indexação 1-based."""
+    """
+    Implementação do Algoritmo de Dijkstra, utilizando o WeightedGridGraph e indexação 1-based.
+
+    d e anterior são listas de tamanho N+1. Com esparso=True são vetores
+    esparsos (VetorEsparso, um dicionário), e a memória de cada consulta
+    passa a ser proporcional aos vértices alcançados, e não ao tamanho do
+    grid: indicado para consultas curtas em mapas grandes. Nos dois modos
+    A não é materializado (A = V - F).
+    """
 
-    def __init__(self, converter: GridToGraphConverter):
+    def __init__(self, converter: GridToGraphConverter, esparso: bool = False):
         self.graph = converter.graph
         # Vértices (1 a N)
         self.V = range(1, self.graph.n + 1)
         self.r_origem = converter.get_start_node()
         self.destino = converter.get_goal_node()
         self.INF = math.inf
+        self.esparso = esparso
         
         # Variáveis do pseudocódigo, ajustadas para indexação 1-based (tamanho N+1)
-        self.d = [self.INF] * (self.graph.n + 1) # d_1i (distância da origem)
-        self.anterior = [None] * (self.graph.n + 1) # anterior(i)
+        self.d = self._vetor(self.INF) # d_1i (distância da origem)
+        self.anterior = self._vetor(None) # anterior(i)
         
-        # A (Conjunto de vértices abertos)
-        self.A: Set[int] = set(self.V)
         # F (Conjunto de vértices fechados)
         self.F: Set[int] = set()
+        # Número de vértices expandidos (fechados) na última execução
+        self.expandidos = 0
+
+    def _vetor(self, padrao) -> Union[List, VetorEsparso]:
+        """Vetor indexado de 1 a N com todas as posições em padrao: lista ou VetorEsparso."""
+        if self.esparso:
+            return VetorEsparso(padrao)
+        return [padrao] * (self.graph.n + 1)
+
+    @property
+    def A(self) -> Set[int]:
+        """A (Conjunto de vértices abertos) = V - F, montado só quando consultado."""
+        return set(self.V) - self.F
 
     def inicializacao(self):
         """Passos de inicialização."""
@@ -198,31 +564,35 @@ class Dijkstra:
         # anterior(i) <- Ø para todo i em V;
         pass
 
-    def executa(self):
-        """Laço principal do algoritmo 'enquanto A != Ø fazer'."""
+    def executa(self, fronteira: str = 'heap'):
+        """
+        Laço principal do algoritmo 'enquanto A != Ø fazer'.
+
+        fronteira escolhe como o vértice aberto mais próximo é encontrado
+        (ver fronteiras.py): 'heap' (padrão, heap binário), 'dial' (fila de
+        baldes, para os custos inteiros de CUSTOS) ou 'linear' (a busca
+        linear do pseudocódigo). Só os vértices já alcançados ficam na
+        fronteira; os infinitos de A nunca seriam escolhidos.
+        """
         
         self.inicializacao()
 
-        while self.A: # enquanto A != Ø fazer
+        abertos = criar_fronteira(fronteira, PESO_MAXIMO)
+        abertos.inserir(self.r_origem, self.d[self.r_origem])
+
+        while len(self.F) < self.graph.n: # enquanto A != Ø fazer (A = V - F)
             
             # r <- v em V | d_1r = min{d_1j}, j em A [acha o vértice mais próximo da origem]
-            r_escolhido: Optional[int] = None
-            min_dist = self.INF
+            minimo = abertos.extrair_minimo()
             
-            # Busca linear para encontrar o mínimo em A (fiel ao pseudocódigo)
-            for j in self.A:
-                if self.d[j] < min_dist:
-                    min_dist = self.d[j]
-                    r_escolhido = j
-            
-            if r_escolhido is None:
+            if minimo is None:
                 break 
 
-            r = r_escolhido
+            r, _ = minimo
 
             # F <- F U {r}; A <- A - {r}; [o vértice r sai de Aberto para Fechado]
             self.F.add(r)
-            self.A.remove(r)
+            self.expandidos += 1
             
             # Otimização: Parar se o objetivo for alcançado
             if r == self.destino:
@@ -234,7 +604,7 @@ class Dijkstra:
             for l_vizinho_index, custo_movimento_v_rl in self.graph.getNeighbors(r):
                 
                 # Verifica se o vizinho 'l' ainda está em A
-                if l_vizinho_index in self.A:
+                if l_vizinho_index not in self.F:
                     
                     # Nova soma: (d_1r + v_rl)
                     nova_soma = self.d[r] + custo_movimento_v_rl
@@ -247,6 +617,7 @@ class Dijkstra:
                         # d_1l <- p; anterior(l) <- r; [ganhou uma nova distância!]
                         self.d[l_vizinho_index] = nova_soma
                         self.anterior[l_vizinho_index] = r
+                        abertos.inserir(l_vizinho_index, nova_soma)
                         
                         # fim;
 
@@ -275,7 +646,223 @@ class Dijkstra:
             
         return caminho_coords
 
-# --- 5. EXECUÇÃO PRINCIPAL ---
+# --- 5. BUSCAS GUIADAS: A* E DIJKSTRA BIDIRECIONAL ---
+
+class AStar(Dijkstra):
+    """
+    A* de S até G com a heurística de Manhattan multiplicada pelo menor
+    custo de movimento de CUSTOS (1, do piso livre). A heurística é
+    consistente, então cada vértice é expandido no máximo uma vez e o
+    custo encontrado é o mesmo do Dijkstra. Mesmo d, anterior,
+    reconstruir_caminho e contador expandidos do Dijkstra.
+    """
+
+    def __init__(self, converter: GridToGraphConverter, esparso: bool = False):
+        super().__init__(converter, esparso)
+        self.num_colunas = converter.num_colunas
+        self.r_destino, self.c_destino = converter.goal_coord
+        self.custo_minimo = CUSTO_MINIMO
+
+    def heuristica(self, v: int) -> float:
+        """Estimativa admissível do custo de v (1-based) até G."""
+        r, c = divmod(v - 1, self.num_colunas)
+        return (abs(r - self.r_destino) + abs(c - self.c_destino)) * self.custo_minimo
+
+    def executa(self, fronteira: str = 'heap'):
+        """Expande os vértices em ordem de d + heurística até fechar G."""
+
+        self.inicializacao()
+
+        # Com heurística consistente, f cresce no máximo peso + custo_minimo por aresta
+        abertos = criar_fronteira(fronteira, PESO_MAXIMO + self.custo_minimo)
+        abertos.inserir(self.r_origem, self.heuristica(self.r_origem))
+
+        while True:
+            minimo = abertos.extrair_minimo()
+            if minimo is None:
+                break
+            r, _ = minimo
+
+            self.F.add(r)
+            self.expandidos += 1
+
+            if r == self.destino:
+                break
+
+            for l_vizinho_index, custo_movimento_v_rl in self.graph.getNeighbors(r):
+                if l_vizinho_index in self.F:
+                    continue
+                nova_soma = self.d[r] + custo_movimento_v_rl
+                if nova_soma < self.d[l_vizinho_index]:
+                    self.d[l_vizinho_index] = nova_soma
+                    self.anterior[l_vizinho_index] = r
+                    abertos.inserir(l_vizinho_index, nova_soma + self.heuristica(l_vizinho_index))
+
+        return self.d, self.anterior
+
+
+class DijkstraBidirecional(Dijkstra):
+    """
+    Dijkstra bidirecional: uma busca parte de S pelas arestas de saída e
+    outra parte de G pelas arestas de entrada (getInNeighbors), expandindo
+    um vértice de cada lado por vez. mu guarda o menor custo S -> G visto
+    numa aresta entre as duas buscas; assim que um vértice é fechado pelas
+    duas, mu é o custo mínimo.
+
+    Ao final, d e anterior são completados ao longo do caminho encontrado,
+    então reconstruir_caminho funciona como no Dijkstra. expandidos soma
+    os vértices fechados pelas duas buscas.
+    """
+
+    def executa(self, fronteira: str = 'heap'):
+        """Executa as duas buscas até se encontrarem."""
+
+        self.inicializacao()
+
+        d_reverso = self._vetor(self.INF)  # custo de cada vértice até G
+        posterior = self._vetor(None)      # próximo vértice no caminho até G
+        d_reverso[self.destino] = 0
+        fechado_reverso: Set[int] = set()
+
+        abertos = criar_fronteira(fronteira, PESO_MAXIMO)
+        abertos_reverso = criar_fronteira(fronteira, PESO_MAXIMO)
+        abertos.inserir(self.r_origem, 0)
+        abertos_reverso.inserir(self.destino, 0)
+
+        mu = 0 if self.r_origem == self.destino else self.INF
+        ponte: Optional[Tuple[int, int]] = None  # aresta (u, w) do melhor caminho visto
+        lado_direto = True
+
+        while mu != 0:
+            if lado_direto:
+                minimo = abertos.extrair_minimo()
+                if minimo is None:
+                    break
+                r, _ = minimo
+                self.F.add(r)
+                self.expandidos += 1
+                if r in fechado_reverso:
+                    break
+                for l, custo in self.graph.getNeighbors(r):
+                    if l in self.F:
+                        continue
+                    nova_soma = self.d[r] + custo
+                    if nova_soma < self.d[l]:
+                        self.d[l] = nova_soma
+                        self.anterior[l] = r
+                        abertos.inserir(l, nova_soma)
+                    if nova_soma + d_reverso[l] < mu:
+                        mu, ponte = nova_soma + d_reverso[l], (r, l)
+            else:
+                minimo = abertos_reverso.extrair_minimo()
+                if minimo is None:
+                    break
+                r, _ = minimo
+                fechado_reverso.add(r)
+                self.expandidos += 1
+                if r in self.F:
+                    break
+                for l, custo in self.graph.getInNeighbors(r):
+                    if l in fechado_reverso:
+                        continue
+                    nova_soma = d_reverso[r] + custo
+                    if nova_soma < d_reverso[l]:
+                        d_reverso[l] = nova_soma
+                        posterior[l] = r
+                        abertos_reverso.inserir(l, nova_soma)
+                    if self.d[l] + nova_soma < mu:
+                        mu, ponte = self.d[l] + nova_soma, (l, r)
+            lado_direto = not lado_direto
+
+        if ponte is not None:
+            # Completa d e anterior do meio do caminho até G
+            u, w = ponte
+            while w is not None:
+                self.anterior[w] = u
+                self.d[w] = mu - d_reverso[w]
+                u, w = w, posterior[w]
+
+        return self.d, self.anterior
+
+class DijkstraMultiplo(Dijkstra):
+    """
+    Dijkstra com várias origens e vários objetivos (todos os 'S' e 'G' do
+    grid, em converter.start_coords e converter.goal_coords). Todas as
+    origens começam com distância 0 e a busca para no primeiro objetivo
+    fechado, que é o objetivo mais próximo de alguma origem: uma única
+    busca, do custo de uma consulta de um só par.
+
+    Depois de executa, destino e r_origem são o objetivo alcançado e a
+    origem de onde o caminho parte, então reconstruir_caminho funciona
+    como no Dijkstra.
+    """
+
+    def __init__(self, converter: GridToGraphConverter, esparso: bool = False):
+        super().__init__(converter, esparso)
+        self.origens = [converter.coord_to_index(coord) + 1 for coord in converter.start_coords]
+        self.objetivos = {converter.coord_to_index(coord) + 1 for coord in converter.goal_coords}
+        # Objetivo alcançado pela última execução (None se nenhum é alcançável)
+        self.objetivo_alcancado: Optional[int] = None
+
+    def inicializacao(self):
+        """Todas as origens com d = 0."""
+        for origem in self.origens:
+            self.d[origem] = 0
+
+    def executa(self, fronteira: str = 'heap'):
+        """Expande a partir de todas as origens até fechar o primeiro objetivo."""
+
+        self.inicializacao()
+
+        abertos = criar_fronteira(fronteira, PESO_MAXIMO)
+        for origem in self.origens:
+            abertos.inserir(origem, 0)
+
+        while True:
+            minimo = abertos.extrair_minimo()
+            if minimo is None:
+                break
+            r, _ = minimo
+
+            self.F.add(r)
+            self.expandidos += 1
+
+            if r in self.objetivos:
+                self.objetivo_alcancado = self.destino = r
+                break
+
+            for l_vizinho_index, custo_movimento_v_rl in self.graph.getNeighbors(r):
+                if l_vizinho_index in self.F:
+                    continue
+                nova_soma = self.d[r] + custo_movimento_v_rl
+                if nova_soma < self.d[l_vizinho_index]:
+                    self.d[l_vizinho_index] = nova_soma
+                    self.anterior[l_vizinho_index] = r
+                    abertos.inserir(l_vizinho_index, nova_soma)
+
+        if self.objetivo_alcancado is not None:
+            # A origem do caminho é o primeiro vértice da cadeia de anteriores
+            vertice = self.objetivo_alcancado
+            while self.anterior[vertice] is not None:
+                vertice = self.anterior[vertice]
+            self.r_origem = vertice
+
+        return self.d, self.anterior
+
+    def objetivo_mais_proximo(self, converter: GridToGraphConverter) -> Tuple[Optional[Tuple[int, int]], float, List[Tuple[int, int]]]:
+        """
+        Executa a busca (se ainda não executada) e retorna (coordenada do
+        objetivo mais próximo, custo, caminho); (None, inf, []) se nenhum
+        objetivo é alcançável.
+        """
+        if not self.F:
+            self.executa()
+        if self.objetivo_alcancado is None:
+            return None, self.INF, []
+        return (converter.index_to_coord(self.objetivo_alcancado - 1),
+                self.d[self.objetivo_alcancado], self.reconstruir_caminho(converter))
+
+# --- 6. EXECUÇÃO PRINCIPAL ---
 
 if __name__ == "__main__":
     nome_arquivo = "grid_example.txt"
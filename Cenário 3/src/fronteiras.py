@@ -0,0 +1,127 @@
+"""
+Fronteiras (filas de prioridade) intercambiáveis para o Dijkstra do cenário 3.
+
+Todas têm a mesma interface:
+
+- inserir(v, prioridade): coloca v na fronteira, ou diminui sua prioridade;
+- extrair_minimo(): remove e retorna (v, prioridade) com a menor
+  prioridade, ou None se a fronteira estiver vazia.
+
+Implementações:
+
+- FronteiraLinear: varredura linear dos vértices abertos, O(V) por
+  extração (a busca do pseudocódigo, mantida como referência);
+- FronteiraHeap: heap binário (heapq) com remoção preguiçosa, O(log V);
+- FronteiraDial: fila de baldes de Dial para pesos inteiros, O(1) por
+  operação, com peso_maximo + 1 baldes usados de forma circular.
+"""
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class FronteiraLinear:
+    """Busca linear do mínimo entre os vértices abertos."""
+
+    def __init__(self, peso_maximo: Optional[int] = None):
+        self.prioridade: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.prioridade)
+
+    def inserir(self, v: int, prioridade: float):
+        self.prioridade[v] = prioridade
+
+    def extrair_minimo(self) -> Optional[Tuple[int, float]]:
+        if not self.prioridade:
+            return None
+        escolhido = min(self.prioridade, key=self.prioridade.__getitem__)
+        return escolhido, self.prioridade.pop(escolhido)
+
+
+class FronteiraHeap:
+    """
+    Heap binário com remoção preguiçosa: diminuir a prioridade de v insere
+    uma nova entrada, e as entradas desatualizadas são descartadas ao sair.
+    """
+
+    def __init__(self, peso_maximo: Optional[int] = None):
+        self.heap: List[Tuple[float, int]] = []
+        self.prioridade: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.prioridade)
+
+    def inserir(self, v: int, prioridade: float):
+        self.prioridade[v] = prioridade
+        heapq.heappush(self.heap, (prioridade, v))
+
+    def extrair_minimo(self) -> Optional[Tuple[int, float]]:
+        while self.heap:
+            prioridade, v = heapq.heappop(self.heap)
+            if self.prioridade.get(v) == prioridade:
+                del self.prioridade[v]
+                return v, prioridade
+        return None
+
+
+class FronteiraDial:
+    """
+    Fila de baldes de Dial. Com pesos inteiros entre 0 e peso_maximo, as
+    prioridades presentes na fronteira estão sempre em [atual, atual +
+    peso_maximo], então peso_maximo + 1 baldes indexados por prioridade
+    módulo (peso_maximo + 1) bastam; a janela começa na prioridade da
+    primeira inserção. Como no heap, diminuir a prioridade
+    deixa uma entrada desatualizada que é ignorada ao sair.
+    """
+
+    def __init__(self, peso_maximo: int):
+        if peso_maximo is None or peso_maximo < 0 or int(peso_maximo) != peso_maximo:
+            raise ValueError("A fila de Dial requer um peso máximo inteiro e não-negativo.")
+        self.num_baldes = int(peso_maximo) + 1
+        self.baldes: List[List[int]] = [[] for _ in range(self.num_baldes)]
+        self.prioridade: Dict[int, int] = {}
+        # Prioridade do último vértice extraído (None antes da primeira inserção)
+        self.atual: Optional[int] = None
+        self.entradas = 0
+
+    def __len__(self) -> int:
+        return len(self.prioridade)
+
+    def inserir(self, v: int, prioridade: int):
+        if self.atual is None:
+            # A janela de baldes começa na prioridade da primeira inserção
+            self.atual = int(prioridade)
+        elif not self.atual <= prioridade < self.atual + self.num_baldes:
+            raise ValueError(f"Prioridade {prioridade} fora da janela [{self.atual}, "
+                             f"{self.atual + self.num_baldes}) da fila de Dial.")
+        self.prioridade[v] = prioridade
+        self.baldes[int(prioridade) % self.num_baldes].append(v)
+        self.entradas += 1
+
+    def extrair_minimo(self) -> Optional[Tuple[int, int]]:
+        while self.entradas:
+            balde = self.baldes[self.atual % self.num_baldes]
+            while balde:
+                v = balde.pop()
+                self.entradas -= 1
+                if self.prioridade.get(v) == self.atual:
+                    del self.prioridade[v]
+                    return v, self.atual
+            self.atual += 1
+        return None
+
+
+FRONTEIRAS = {
+    'linear': FronteiraLinear,
+    'heap': FronteiraHeap,
+    'dial': FronteiraDial,
+}
+
+
+def criar_fronteira(nome: str, peso_maximo: Optional[int] = None):
+    """Instancia a fronteira pelo nome ('linear', 'heap' ou 'dial')."""
+    try:
+        classe = FRONTEIRAS[nome]
+    except KeyError:
+        raise ValueError(f"Fronteira desconhecida: '{nome}'. Use uma de {sorted(FRONTEIRAS)}.") from None
+    return classe(peso_maximo)
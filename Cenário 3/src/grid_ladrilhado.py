@@ -0,0 +1,251 @@
+"""
+Grids ladrilhados, carregados sob demanda, para mapas maiores que a memória.
+
+Formato do arquivo (gravado por converter_para_ladrilhos):
+
+- cabeçalho b'GTL1', num_linhas, num_colunas, tamanho_ladrilho e o número
+  de pontos 'S'/'G' (uint32 little-endian);
+- os ladrilhos de tamanho_ladrilho x tamanho_ladrilho bytes, um byte por
+  célula, em ordem de linha de ladrilhos; os ladrilhos da borda são
+  completados com '#', então todo ladrilho tem o mesmo tamanho e sua
+  posição no arquivo é calculada direto;
+- o índice dos pontos: (caractere, r, c) para cada 'S' e 'G', para que o
+  GridToGraphConverter os encontre sem varrer o mapa.
+
+GridLadrilhado lê um ladrilho do disco só quando a busca pede uma célula
+dele e mantém no máximo capacidade_cache ladrilhos em memória (LRU), com
+contadores de acertos e faltas. O grid é somente leitura. Com
+AStar(converter, esparso=True) (ou Dijkstra) o estado da busca também
+fica em vetores esparsos, e a memória da busca acompanha a região
+explorada, e não o tamanho do mapa.
+"""
+import math
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from cen3 import TABELA_CUSTOS, ImplicitGridGraph
+
+TAMANHO_LADRILHO_PADRAO = 64
+CAPACIDADE_CACHE_PADRAO = 256
+
+_MAGICO = b'GTL1'
+# mágico, linhas, colunas, tamanho do ladrilho, número de pontos
+_CABECALHO = struct.Struct('<4sIIII')
+# caractere, linha, coluna
+_PONTO = struct.Struct('<BII')
+
+_BLOQUEIO = ord('#')
+
+
+def converter_para_ladrilhos(arquivo_texto: str, arquivo_ladrilhos: str,
+                             tamanho_ladrilho: int = TAMANHO_LADRILHO_PADRAO):
+    """
+    Converte um grid no formato de grid_example.txt para o formato
+    ladrilhado. Lê uma faixa de tamanho_ladrilho linhas por vez, então a
+    memória usada é O(tamanho_ladrilho x num_colunas).
+    """
+    if tamanho_ladrilho < 1:
+        raise ValueError("tamanho_ladrilho deve ser positivo.")
+    t = tamanho_ladrilho
+    pontos = []
+    with open(arquivo_texto, 'rb') as entrada, open(arquivo_ladrilhos, 'wb') as saida:
+        linhas = (linha.strip() for linha in entrada)
+        linhas = (linha for linha in linhas if linha)
+        try:
+            num_linhas, num_colunas = map(int, next(linhas).split())
+        except (StopIteration, ValueError):
+            raise ValueError(f"'{arquivo_texto}': cabeçalho 'i j' não encontrado.") from None
+        saida.write(_CABECALHO.pack(_MAGICO, num_linhas, num_colunas, t, 0))
+
+        largura = -(-num_colunas // t) * t
+        for r_ini in range(0, num_linhas, t):
+            faixa = []
+            for r in range(r_ini, min(r_ini + t, num_linhas)):
+                linha = next(linhas, None)
+                if linha is None or len(linha) != num_colunas:
+                    raise ValueError(f"'{arquivo_texto}': a linha {r + 2} do grid não tem {num_colunas} células.")
+                for caractere in (b'S', b'G'):
+                    c = linha.find(caractere)
+                    while c != -1:
+                        pontos.append((caractere[0], r, c))
+                        c = linha.find(caractere, c + 1)
+                faixa.append(linha.ljust(largura, b'#'))
+            faixa.extend([b'#' * largura] * (t - len(faixa)))
+            for c_ini in range(0, largura, t):
+                saida.write(b''.join(linha[c_ini:c_ini + t] for linha in faixa))
+
+        for ponto in pontos:
+            saida.write(_PONTO.pack(*ponto))
+        saida.seek(0)
+        saida.write(_CABECALHO.pack(_MAGICO, num_linhas, num_colunas, t, len(pontos)))
+
+
+class LinhaLadrilhada:
+    """Visão somente leitura de uma linha do GridLadrilhado: linha[c] é o caractere."""
+
+    def __init__(self, grid: 'GridLadrilhado', r: int):
+        self.grid, self.r = grid, r
+
+    def __len__(self) -> int:
+        return self.grid.num_colunas
+
+    def __getitem__(self, c: int) -> str:
+        if not 0 <= c < self.grid.num_colunas:
+            raise IndexError(c)
+        return chr(self.grid.byte(self.r, c))
+
+    def __iter__(self):
+        for c in range(self.grid.num_colunas):
+            yield chr(self.grid.byte(self.r, c))
+
+
+class GridLadrilhado:
+    """
+    Grid lido ladrilho a ladrilho de um arquivo gravado por
+    converter_para_ladrilhos, com cache LRU de capacidade_cache ladrilhos.
+    grid[r][c] funciona como na lista de listas (somente leitura).
+    """
+
+    def __init__(self, arquivo_ladrilhos: str, capacidade_cache: int = CAPACIDADE_CACHE_PADRAO):
+        if capacidade_cache < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self._arquivo = open(arquivo_ladrilhos, 'rb')
+        try:
+            magico, num_linhas, num_colunas, t, num_pontos = _CABECALHO.unpack(self._arquivo.read(_CABECALHO.size))
+            if magico != _MAGICO:
+                raise ValueError(f"'{arquivo_ladrilhos}' não é um arquivo de grid ladrilhado.")
+            self.num_linhas, self.num_colunas, self.tamanho_ladrilho = num_linhas, num_colunas, t
+            self.ladrilhos_por_linha = -(-num_colunas // t)
+            num_ladrilhos = -(-num_linhas // t) * self.ladrilhos_por_linha
+            self._arquivo.seek(_CABECALHO.size + num_ladrilhos * t * t)
+            dados_pontos = self._arquivo.read(num_pontos * _PONTO.size)
+            if len(dados_pontos) != num_pontos * _PONTO.size:
+                raise ValueError(f"'{arquivo_ladrilhos}' está truncado.")
+        except Exception:
+            self._arquivo.close()
+            raise
+
+        self.pontos: Dict[str, List[Tuple[int, int]]] = {'S': [], 'G': []}
+        for caractere, r, c in _PONTO.iter_unpack(dados_pontos):
+            self.pontos[chr(caractere)].append((r, c))
+
+        self.capacidade_cache = capacidade_cache
+        self._cache: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._ultima_chave: Optional[int] = None
+        self._ultimo_ladrilho = b''
+        self.acertos = 0
+        self.faltas = 0
+
+    def __len__(self) -> int:
+        return self.num_linhas
+
+    def __getitem__(self, r: int) -> LinhaLadrilhada:
+        if not 0 <= r < self.num_linhas:
+            raise IndexError(r)
+        return LinhaLadrilhada(self, r)
+
+    def __iter__(self):
+        for r in range(self.num_linhas):
+            yield self[r]
+
+    def _ladrilho(self, chave: int) -> bytes:
+        """Bytes do ladrilho de índice chave, do cache ou do disco."""
+        if chave == self._ultima_chave:
+            self.acertos += 1
+            return self._ultimo_ladrilho
+        ladrilho = self._cache.get(chave)
+        if ladrilho is not None:
+            self._cache.move_to_end(chave)
+            self.acertos += 1
+        else:
+            self.faltas += 1
+            tamanho = self.tamanho_ladrilho * self.tamanho_ladrilho
+            self._arquivo.seek(_CABECALHO.size + chave * tamanho)
+            ladrilho = self._arquivo.read(tamanho)
+            self._cache[chave] = ladrilho
+            if len(self._cache) > self.capacidade_cache:
+                self._cache.popitem(last=False)
+        self._ultima_chave, self._ultimo_ladrilho = chave, ladrilho
+        return ladrilho
+
+    def byte(self, r: int, c: int) -> int:
+        """Byte da célula (r, c)."""
+        t = self.tamanho_ladrilho
+        tr, r_local = divmod(r, t)
+        tc, c_local = divmod(c, t)
+        return self._ladrilho(tr * self.ladrilhos_por_linha + tc)[r_local * t + c_local]
+
+    def custo(self, r: int, c: int) -> float:
+        """Custo de entrar na célula (r, c)."""
+        return TABELA_CUSTOS[self.byte(r, c)]
+
+    @property
+    def ladrilhos_em_memoria(self) -> int:
+        return len(self._cache)
+
+    def encontrar_todos(self, caractere: str) -> List[Tuple[int, int]]:
+        """Coordenadas dos 'S' ou 'G', lidas do índice de pontos do arquivo."""
+        if caractere not in self.pontos:
+            raise ValueError("O índice do grid ladrilhado só guarda os pontos 'S' e 'G'.")
+        return list(self.pontos[caractere])
+
+    def criar_grafo(self) -> 'TiledGridGraph':
+        """Grafo implícito que lê este grid (usado por GridToGraphConverter)."""
+        return TiledGridGraph(self.num_linhas, self.num_colunas, self)
+
+    def fechar(self):
+        self._cache.clear()
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class TiledGridGraph(ImplicitGridGraph):
+    """ImplicitGridGraph sobre um GridLadrilhado: cada célula lida carrega (no máximo) o seu ladrilho."""
+
+    def getNeighbors(self, v: int):
+        """Retorna vizinhos de v e o custo do movimento (peso), em ordem crescente de índice."""
+        byte, tabela = self.grid.byte, TABELA_CUSTOS
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        if byte(r, c) == _BLOQUEIO:
+            return
+        if r > 0:
+            peso = tabela[byte(r - 1, c)]
+            if peso != math.inf:
+                yield (v - num_colunas, peso)
+        if c > 0:
+            peso = tabela[byte(r, c - 1)]
+            if peso != math.inf:
+                yield (v - 1, peso)
+        if c + 1 < num_colunas:
+            peso = tabela[byte(r, c + 1)]
+            if peso != math.inf:
+                yield (v + 1, peso)
+        if r + 1 < self.num_linhas:
+            peso = tabela[byte(r + 1, c)]
+            if peso != math.inf:
+                yield (v + num_colunas, peso)
+
+    def getInNeighbors(self, v: int):
+        """Retorna os vértices com aresta para v e o custo dessa aresta (busca reversa)."""
+        byte = self.grid.byte
+        num_colunas = self.num_colunas
+        r, c = divmod(v - 1, num_colunas)
+        peso = TABELA_CUSTOS[byte(r, c)]
+        if peso == math.inf:
+            return
+        if r > 0 and byte(r - 1, c) != _BLOQUEIO:
+            yield (v - num_colunas, peso)
+        if c > 0 and byte(r, c - 1) != _BLOQUEIO:
+            yield (v - 1, peso)
+        if c + 1 < num_colunas and byte(r, c + 1) != _BLOQUEIO:
+            yield (v + 1, peso)
+        if r + 1 < self.num_linhas and byte(r + 1, c) != _BLOQUEIO:
+            yield (v + num_colunas, peso)
+
@@ -0,0 +1,303 @@
+"""
+Busca hierárquica (HPA*) para mapas grandes, estáticos e consultados muitas vezes.
+
+O grid é dividido em clusters de tamanho_cluster x tamanho_cluster células.
+Na construção (feita uma única vez, e que pode ser salva em disco):
+
+- cada trecho contínuo de células livres na fronteira entre dois clusters
+  vizinhos vira uma ou duas transições (uma no meio do trecho, ou uma em
+  cada ponta se o trecho for longo); as duas células de cada transição são
+  nós do grafo abstrato, ligadas pelo custo de entrar uma na outra;
+- dentro de cada cluster, o custo mínimo entre cada par de nós (com a busca
+  restrita ao cluster) vira uma aresta do grafo abstrato.
+
+Cada consulta S -> G liga S e G aos nós dos seus clusters, faz um A* no
+grafo abstrato (pequeno) e refina só os trechos escolhidos, com buscas
+restritas a um cluster por vez. O custo independe do tamanho do mapa, mas
+o caminho é quase ótimo: como as rotas ficam presas às transições, pode
+custar um pouco mais que o do Dijkstra. O custo devolvido é sempre o custo
+exato do caminho devolvido.
+
+Os índices das células são 0-based (r * num_colunas + c), como em
+GridToGraphConverter.coord_to_index.
+"""
+import hashlib
+import heapq
+import json
+import math
+from typing import Dict, List, Optional, Tuple
+
+from cen3 import CUSTO_CARACTERE, CUSTO_MINIMO, GridToGraphConverter
+
+TAMANHO_CLUSTER_PADRAO = 16
+
+# Trechos de fronteira com pelo menos este comprimento ganham duas transições
+LIMIAR_TRECHO_LONGO = 6
+
+_VERSAO_FORMATO = 1
+
+
+def hash_grid(grid: List[List[str]]) -> str:
+    """
+    SHA-256 do grid com 'S' e 'G' trocados por '.', para que a mesma
+    abstração sirva para qualquer par de pontos de início e objetivo.
+    """
+    h = hashlib.sha256()
+    for linha in grid:
+        h.update(''.join(linha).replace('S', '.').replace('G', '.').encode())
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+class AbstracaoHierarquica:
+    """
+    Grafo abstrato do HPA* sobre o grid de um GridToGraphConverter.
+
+    arestas[u] = {w: custo} entre nós abstratos (índices de célula 0-based).
+    expandidos conta os nós abstratos expandidos pelo A* da última consulta.
+    """
+
+    def __init__(self, converter: GridToGraphConverter, tamanho_cluster: int = TAMANHO_CLUSTER_PADRAO,
+                 arestas: Optional[Dict[int, Dict[int, float]]] = None):
+        if tamanho_cluster < 1:
+            raise ValueError("tamanho_cluster deve ser positivo.")
+        self.grid = converter.grid
+        self.num_linhas = converter.num_linhas
+        self.num_colunas = converter.num_colunas
+        self.tamanho_cluster = tamanho_cluster
+        self.custo_minimo = CUSTO_MINIMO
+        self.expandidos = 0
+        self.arestas = self._construir() if arestas is None else arestas
+
+    # --- Geometria dos clusters ---
+
+    def _custo(self, celula: int) -> float:
+        r, c = divmod(celula, self.num_colunas)
+        return CUSTO_CARACTERE.get(self.grid[r][c], math.inf)
+
+    def _livre(self, celula: int) -> bool:
+        r, c = divmod(celula, self.num_colunas)
+        return self.grid[r][c] != '#' and self._custo(celula) != math.inf
+
+    def _cluster(self, celula: int) -> Tuple[int, int]:
+        r, c = divmod(celula, self.num_colunas)
+        return r // self.tamanho_cluster, c // self.tamanho_cluster
+
+    def _limites(self, cluster: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        cr, cc = cluster
+        t = self.tamanho_cluster
+        return (cr * t, min((cr + 1) * t, self.num_linhas),
+                cc * t, min((cc + 1) * t, self.num_colunas))
+
+    def _busca_no_cluster(self, origem: int, reverso: bool = False,
+                          alvo: Optional[int] = None) -> Tuple[Dict[int, float], Dict[int, int]]:
+        """
+        Dijkstra restrito ao cluster de 'origem'. Com reverso=True percorre
+        as arestas ao contrário (custos até 'origem'). Para ao fechar 'alvo'.
+        Retorna (dist, anterior) como dicionários por célula.
+        """
+        r_ini, r_fim, c_ini, c_fim = self._limites(self._cluster(origem))
+        num_colunas, grid = self.num_colunas, self.grid
+        dist = {origem: 0}
+        anterior: Dict[int, int] = {}
+        fechado = set()
+        heap = [(0, origem)]
+        while heap:
+            d_v, v = heapq.heappop(heap)
+            if v in fechado:
+                continue
+            fechado.add(v)
+            if v == alvo:
+                break
+            r, c = divmod(v, num_colunas)
+            if reverso:
+                custo_v = self._custo(v)
+                if custo_v == math.inf:
+                    continue
+            elif grid[r][c] == '#':
+                continue
+            for dr, dc in ((-1, 0), (0, -1), (0, 1), (1, 0)):
+                rw, cw = r + dr, c + dc
+                if not (r_ini <= rw < r_fim and c_ini <= cw < c_fim):
+                    continue
+                w = rw * num_colunas + cw
+                if reverso:
+                    # Aresta original w -> v: sai de w (não pode ser '#') e custa entrar em v
+                    if grid[rw][cw] == '#':
+                        continue
+                    peso = custo_v
+                else:
+                    peso = self._custo(w)
+                    if peso == math.inf:
+                        continue
+                nova = d_v + peso
+                if nova < dist.get(w, math.inf):
+                    dist[w] = nova
+                    anterior[w] = v
+                    heapq.heappush(heap, (nova, w))
+        return dist, anterior
+
+    # --- Construção ---
+
+    def _transicoes(self) -> List[Tuple[int, int]]:
+        """Pares (a, b) de células vizinhas em clusters diferentes escolhidas como transições."""
+        t = self.tamanho_cluster
+        pares = []
+
+        def fechar_trecho(trecho):
+            if len(trecho) >= LIMIAR_TRECHO_LONGO:
+                pares.extend((trecho[0], trecho[-1]))
+            elif trecho:
+                pares.append(trecho[len(trecho) // 2])
+
+        # Fronteiras horizontais (entre a linha r-1 e a linha r)
+        for r in range(t, self.num_linhas, t):
+            for c_ini in range(0, self.num_colunas, t):
+                trecho = []
+                for c in range(c_ini, min(c_ini + t, self.num_colunas)):
+                    a, b = (r - 1) * self.num_colunas + c, r * self.num_colunas + c
+                    if self._livre(a) and self._livre(b):
+                        trecho.append((a, b))
+                    else:
+                        fechar_trecho(trecho)
+                        trecho = []
+                fechar_trecho(trecho)
+
+        # Fronteiras verticais (entre a coluna c-1 e a coluna c)
+        for c in range(t, self.num_colunas, t):
+            for r_ini in range(0, self.num_linhas, t):
+                trecho = []
+                for r in range(r_ini, min(r_ini + t, self.num_linhas)):
+                    a, b = r * self.num_colunas + c - 1, r * self.num_colunas + c
+                    if self._livre(a) and self._livre(b):
+                        trecho.append((a, b))
+                    else:
+                        fechar_trecho(trecho)
+                        trecho = []
+                fechar_trecho(trecho)
+        return pares
+
+    def _construir(self) -> Dict[int, Dict[int, float]]:
+        arestas: Dict[int, Dict[int, float]] = {}
+        nos_por_cluster: Dict[Tuple[int, int], set] = {}
+        for a, b in self._transicoes():
+            arestas.setdefault(a, {})[b] = self._custo(b)
+            arestas.setdefault(b, {})[a] = self._custo(a)
+            nos_por_cluster.setdefault(self._cluster(a), set()).add(a)
+            nos_por_cluster.setdefault(self._cluster(b), set()).add(b)
+
+        for nos in nos_por_cluster.values():
+            for u in nos:
+                dist, _ = self._busca_no_cluster(u)
+                for w in nos:
+                    if w != u and w in dist:
+                        arestas[u][w] = dist[w]
+        return arestas
+
+    # --- Serialização ---
+
+    def salvar(self, caminho_arquivo: str):
+        """Grava a abstração em JSON, com o hash do grid para validar a carga."""
+        dados = {
+            'versao': _VERSAO_FORMATO,
+            'num_linhas': self.num_linhas,
+            'num_colunas': self.num_colunas,
+            'tamanho_cluster': self.tamanho_cluster,
+            'hash_grid': hash_grid(self.grid),
+            'arestas': [[u, w, custo] for u, vizinhos in self.arestas.items()
+                        for w, custo in vizinhos.items()],
+        }
+        with open(caminho_arquivo, 'w') as f:
+            json.dump(dados, f)
+
+    @classmethod
+    def carregar(cls, caminho_arquivo: str, converter: GridToGraphConverter) -> 'AbstracaoHierarquica':
+        """
+        Carrega uma abstração gravada por salvar. Lança ValueError se ela
+        foi construída para outro grid.
+        """
+        with open(caminho_arquivo, 'r') as f:
+            dados = json.load(f)
+        if dados.get('versao') != _VERSAO_FORMATO:
+            raise ValueError(f"'{caminho_arquivo}' não é uma abstração hierárquica reconhecida.")
+        if (dados['num_linhas'], dados['num_colunas']) != (converter.num_linhas, converter.num_colunas) \
+                or dados['hash_grid'] != hash_grid(converter.grid):
+            raise ValueError(f"A abstração em '{caminho_arquivo}' foi construída para outro grid.")
+        arestas: Dict[int, Dict[int, float]] = {}
+        for u, w, custo in dados['arestas']:
+            arestas.setdefault(u, {})[w] = custo
+        return cls(converter, dados['tamanho_cluster'], arestas)
+
+    # --- Consulta ---
+
+    def _heuristica(self, celula: int, destino: int) -> float:
+        r, c = divmod(celula, self.num_colunas)
+        r_g, c_g = divmod(destino, self.num_colunas)
+        return (abs(r - r_g) + abs(c - c_g)) * self.custo_minimo
+
+    def _refinar(self, nos: List[int]) -> List[int]:
+        """Expande a sequência de nós abstratos em células do grid."""
+        celulas = [nos[0]]
+        for u, w in zip(nos, nos[1:]):
+            if self._cluster(u) != self._cluster(w):
+                # Aresta de transição: as células já são vizinhas
+                celulas.append(w)
+                continue
+            _, anterior = self._busca_no_cluster(u, alvo=w)
+            trecho = [w]
+            while trecho[-1] != u:
+                trecho.append(anterior[trecho[-1]])
+            celulas.extend(trecho[-2::-1])
+        return celulas
+
+    def consultar(self, origem: Tuple[int, int], destino: Tuple[int, int]) -> Tuple[float, List[Tuple[int, int]]]:
+        """
+        Caminho de origem até destino (coordenadas (r, c) 0-based).
+        Retorna (custo, caminho) com o caminho no formato de
+        Dijkstra.reconstruir_caminho; (inf, []) se não houver caminho.
+        """
+        s = origem[0] * self.num_colunas + origem[1]
+        g = destino[0] * self.num_colunas + destino[1]
+        self.expandidos = 0
+        if s == g:
+            return 0, [origem]
+
+        # Arestas temporárias ligando S e G aos nós dos seus clusters
+        extras: Dict[int, Dict[int, float]] = {s: {}}
+        dist_s, _ = self._busca_no_cluster(s)
+        dist_g, _ = self._busca_no_cluster(g, reverso=True)
+        for u in dist_s:
+            if u in self.arestas or u == g:
+                extras[s][u] = dist_s[u]
+        for u in dist_g:
+            if u in self.arestas and u != g:
+                extras.setdefault(u, {})[g] = dist_g[u]
+
+        # A* no grafo abstrato
+        d = {s: 0}
+        anterior: Dict[int, int] = {}
+        fechado = set()
+        heap = [(self._heuristica(s, g), s)]
+        while heap:
+            _, u = heapq.heappop(heap)
+            if u in fechado:
+                continue
+            fechado.add(u)
+            self.expandidos += 1
+            if u == g:
+                break
+            for vizinhos in (self.arestas.get(u, {}), extras.get(u, {})):
+                for w, custo in vizinhos.items():
+                    nova = d[u] + custo
+                    if nova < d.get(w, math.inf):
+                        d[w] = nova
+                        anterior[w] = u
+                        heapq.heappush(heap, (nova + self._heuristica(w, g), w))
+
+        if g not in d:
+            return math.inf, []
+        nos = [g]
+        while nos[-1] != s:
+            nos.append(anterior[nos[-1]])
+        celulas = self._refinar(nos[::-1])
+        return d[g], [divmod(celula, self.num_colunas) for celula in celulas]
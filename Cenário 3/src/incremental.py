@@ -0,0 +1,174 @@
+"""
+Replanejamento incremental (D* Lite) para mapas em que as células mudam.
+
+O planejador guarda o estado da busca entre as consultas: g[v] (custo de
+v até G conhecido) e rhs[v] (custo previsto a partir dos sucessores). A
+busca parte de G pelas arestas de entrada, como no campo de distâncias,
+e é guiada pela heurística de Manhattan até o início do robô, como no A*.
+
+Quando uma célula muda (atualizar_celula), só ela e seus vizinhos têm o
+rhs recalculado; a próxima chamada a planejar re-expande apenas os
+vértices cujo custo realmente mudou. Quando o robô anda (mover_inicio),
+o deslocamento km corrige as chaves antigas da fila em vez de reconstruí-la.
+
+expandidos conta os vértices expandidos pela última chamada a planejar;
+replanejamento_completo diz quantos um A* do zero expandiria no mesmo mapa.
+
+Os vértices são 1-based, como no grafo do GridToGraphConverter.
+"""
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from cen3 import CUSTO_MINIMO, CUSTOS, AStar, GridToGraphConverter
+
+Coordenada = Tuple[int, int]
+Chave = Tuple[float, float]
+
+# Caracteres que atualizar_celula aceita ('S' e 'G' são definidos pelo planejador)
+CARACTERES_CELULA = tuple(caractere for caractere in CUSTOS if caractere not in ('S', 'G'))
+
+
+class PlanejadorIncremental:
+    """D* Lite de converter.start_coord até converter.goal_coord sobre o grafo implícito."""
+
+    def __init__(self, converter: GridToGraphConverter):
+        self.converter = converter
+        self.graph = converter.graph
+        if not hasattr(self.graph, 'getInNeighbors') or not hasattr(self.graph, 'grid'):
+            raise ValueError("O planejador incremental requer o grafo implícito (implicito=True).")
+        self.num_colunas = converter.num_colunas
+        self.custo_minimo = CUSTO_MINIMO
+
+        self.inicio = converter.get_start_node()
+        self.destino = converter.get_goal_node()
+        self.ultimo_inicio = self.inicio
+        self.km = 0
+
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {self.destino: 0}
+        # Fila com remoção preguiçosa: chave_aberta guarda a chave válida de cada vértice aberto
+        self.fila: List[Tuple[float, float, int]] = []
+        self.chave_aberta: Dict[int, Chave] = {}
+        self._inserir(self.destino, self._calcular_chave(self.destino))
+
+        self.expandidos = 0
+        self.expandidos_total = 0
+
+    # --- Fila de prioridade ---
+
+    def _inserir(self, v: int, chave: Chave):
+        self.chave_aberta[v] = chave
+        heapq.heappush(self.fila, (chave[0], chave[1], v))
+
+    def _topo(self) -> Tuple[Chave, Optional[int]]:
+        while self.fila:
+            k1, k2, v = self.fila[0]
+            if self.chave_aberta.get(v) == (k1, k2):
+                return (k1, k2), v
+            heapq.heappop(self.fila)
+        return (math.inf, math.inf), None
+
+    # --- D* Lite ---
+
+    def _heuristica(self, a: int, b: int) -> float:
+        r_a, c_a = divmod(a - 1, self.num_colunas)
+        r_b, c_b = divmod(b - 1, self.num_colunas)
+        return (abs(r_a - r_b) + abs(c_a - c_b)) * self.custo_minimo
+
+    def _calcular_chave(self, v: int) -> Chave:
+        minimo = min(self.g.get(v, math.inf), self.rhs.get(v, math.inf))
+        return (minimo + self._heuristica(self.inicio, v) + self.km, minimo)
+
+    def _atualizar_vertice(self, u: int):
+        if u != self.destino:
+            self.rhs[u] = min((custo + self.g.get(s, math.inf) for s, custo in self.graph.getNeighbors(u)),
+                              default=math.inf)
+        self.chave_aberta.pop(u, None)
+        if self.g.get(u, math.inf) != self.rhs.get(u, math.inf):
+            self._inserir(u, self._calcular_chave(u))
+
+    def _calcular_caminho_minimo(self):
+        self.expandidos = 0
+        while True:
+            chave_topo, u = self._topo()
+            chave_inicio = self._calcular_chave(self.inicio)
+            if u is None or (chave_topo >= chave_inicio
+                             and self.rhs.get(self.inicio, math.inf) == self.g.get(self.inicio, math.inf)):
+                break
+            chave_nova = self._calcular_chave(u)
+            if chave_topo < chave_nova:
+                # Chave calculada com um km antigo: só reposiciona
+                self._inserir(u, chave_nova)
+                continue
+            heapq.heappop(self.fila)
+            del self.chave_aberta[u]
+            self.expandidos += 1
+            if self.g.get(u, math.inf) > self.rhs[u]:
+                self.g[u] = self.rhs[u]
+                for p, _ in self.graph.getInNeighbors(u):
+                    self._atualizar_vertice(p)
+            else:
+                self.g[u] = math.inf
+                self._atualizar_vertice(u)
+                for p, _ in self.graph.getInNeighbors(u):
+                    self._atualizar_vertice(p)
+        self.expandidos_total += self.expandidos
+
+    # --- API ---
+
+    def planejar(self) -> Tuple[float, List[Coordenada]]:
+        """
+        Repara a busca e retorna (custo, caminho) do início atual até G,
+        com o caminho no formato de Dijkstra.reconstruir_caminho
+        ((inf, []) se G estiver inalcançável).
+        """
+        self._calcular_caminho_minimo()
+        custo = self.g.get(self.inicio, math.inf)
+        if custo == math.inf:
+            return math.inf, []
+
+        caminho = [self.inicio]
+        v = self.inicio
+        while v != self.destino:
+            v = min(self.graph.getNeighbors(v), key=lambda par: par[1] + self.g.get(par[0], math.inf))[0]
+            caminho.append(v)
+            if len(caminho) > self.graph.n:
+                raise RuntimeError("O caminho reconstruído entrou num ciclo.")
+        return custo, [self.converter.index_to_coord(v - 1) for v in caminho]
+
+    def atualizar_celula(self, r: int, c: int, caractere: str):
+        """
+        Troca o conteúdo da célula (r, c) por caractere ('.', '~' ou '#') e
+        marca para reparo a célula e seus vizinhos, cujas arestas mudaram.
+        """
+        if caractere not in CARACTERES_CELULA:
+            raise ValueError(f"Caractere inválido: '{caractere}'. Use um de {CARACTERES_CELULA}.")
+        if not (0 <= r < self.converter.num_linhas and 0 <= c < self.num_colunas):
+            raise ValueError(f"A coordenada {(r, c)} está fora do grid.")
+        v = self.converter.coord_to_index((r, c)) + 1
+        if v in (self.inicio, self.destino):
+            raise ValueError("Não é possível alterar a célula de início ou de objetivo.")
+        if self.converter.grid[r][c] == caractere:
+            return
+        self.converter.grid[r][c] = caractere
+
+        # As arestas que mudaram ligam v aos 4 vizinhos, nos dois sentidos
+        self._atualizar_vertice(v)
+        for dr, dc in ((-1, 0), (0, -1), (0, 1), (1, 0)):
+            r_w, c_w = r + dr, c + dc
+            if 0 <= r_w < self.converter.num_linhas and 0 <= c_w < self.num_colunas:
+                self._atualizar_vertice(r_w * self.num_colunas + c_w + 1)
+
+    def mover_inicio(self, r: int, c: int):
+        """Move o robô para (r, c); a busca continua válida, só as chaves são corrigidas por km."""
+        novo_inicio = self.converter.coord_to_index((r, c)) + 1
+        self.km += self._heuristica(self.ultimo_inicio, novo_inicio)
+        self.ultimo_inicio = self.inicio = novo_inicio
+        self.converter.start_coord = (r, c)
+
+    def replanejamento_completo(self) -> int:
+        """Vértices que um A* do zero expandiria do início atual até G, para comparação."""
+        solver = AStar(self.converter, esparso=True)
+        solver.executa()
+        return solver.expandidos
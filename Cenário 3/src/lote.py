@@ -0,0 +1,115 @@
+"""
+Consultas em lote para uma frota de robôs no mesmo mapa.
+
+resolver_lote recebe um grid e uma lista de pares (início, objetivo),
+prepara o grid uma única vez (conversor, grafo implícito e, no modo
+'hpa', a abstração hierárquica) e distribui as consultas num pool de
+processos. Cada processo recebe o grid pré-processado pelo inicializador
+do pool, uma vez só; com o método 'fork' (padrão no Linux) isso é a
+própria memória herdada do processo pai, sem cópia nem serialização.
+
+Retorna um (custo, caminho) por par, na ordem dos pares, e a vazão em
+consultas por segundo.
+"""
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from cen3 import AStar, Dijkstra, DijkstraBidirecional, GridToGraphConverter, ler_grid_do_arquivo
+from hierarquico import AbstracaoHierarquica
+
+Coordenada = Tuple[int, int]
+
+ALGORITMOS = {
+    'dijkstra': Dijkstra,
+    'astar': AStar,
+    'bidirecional': DijkstraBidirecional,
+}
+
+# Estado de cada processo do pool (preenchido por _inicializar_worker)
+_converter_worker: Optional[GridToGraphConverter] = None
+_abstracao_worker: Optional[AbstracaoHierarquica] = None
+_algoritmo_worker: Optional[str] = None
+
+
+def _inicializar_worker(converter, abstracao, algoritmo):
+    global _converter_worker, _abstracao_worker, _algoritmo_worker
+    _converter_worker, _abstracao_worker, _algoritmo_worker = converter, abstracao, algoritmo
+
+
+def _resolver_par(converter: GridToGraphConverter, abstracao: Optional[AbstracaoHierarquica],
+                  algoritmo: str, par: Tuple[Coordenada, Coordenada]) -> Tuple[float, List[Coordenada]]:
+    origem, destino = par
+    converter.definir_pontos(origem, destino)
+    if abstracao is not None:
+        return abstracao.consultar(converter.start_coord, converter.goal_coord)
+    # Estado esparso: cada consulta só aloca o que a busca alcança
+    solver = ALGORITMOS[algoritmo](converter, esparso=True)
+    solver.executa()
+    return solver.d[solver.destino], solver.reconstruir_caminho(converter)
+
+
+def _resolver_par_worker(par):
+    return _resolver_par(_converter_worker, _abstracao_worker, _algoritmo_worker, par)
+
+
+def resolver_lote(num_linhas: int, num_colunas: int, grid: List[List[str]],
+                  pares: List[Tuple[Coordenada, Coordenada]], algoritmo: str = 'astar',
+                  num_workers: Optional[int] = None,
+                  tamanho_cluster: Optional[int] = None) -> Tuple[List[Tuple[float, List[Coordenada]]], float]:
+    """
+    Resolve cada par (início, objetivo), em coordenadas (r, c) 0-based.
+
+    algoritmo: 'astar' (padrão), 'dijkstra', 'bidirecional' ou 'hpa' (a
+    abstração hierárquica é construída uma vez, com tamanho_cluster).
+    num_workers: processos do pool (None usa os.cpu_count(); 1 resolve no
+    processo atual).
+
+    Retorna (resultados, consultas_por_segundo): resultados[i] é (custo,
+    caminho) do par i, com (inf, []) para pares sem caminho; a vazão é
+    medida só na fase de consultas, depois do pré-processamento.
+    """
+    if algoritmo != 'hpa' and algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconhecido: '{algoritmo}'.")
+    pares = list(pares)
+
+    # Pré-processamento único, compartilhado por todas as consultas
+    converter = GridToGraphConverter(num_linhas, num_colunas, grid, exigir_pontos=False)
+    for origem, destino in pares:
+        converter.definir_pontos(origem, destino)
+    abstracao = None
+    if algoritmo == 'hpa':
+        if tamanho_cluster is None:
+            abstracao = AbstracaoHierarquica(converter)
+        else:
+            abstracao = AbstracaoHierarquica(converter, tamanho_cluster)
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    inicio = time.perf_counter()
+    if num_workers == 1 or len(pares) < 2:
+        resultados = [_resolver_par(converter, abstracao, algoritmo, par) for par in pares]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_inicializar_worker,
+                                 initargs=(converter, abstracao, algoritmo)) as pool:
+            resultados = list(pool.map(_resolver_par_worker, pares,
+                                       chunksize=max(1, len(pares) // (4 * num_workers))))
+    duracao = time.perf_counter() - inicio
+    consultas_por_segundo = len(pares) / duracao if duracao > 0 else math.inf
+    return resultados, consultas_por_segundo
+
+
+if __name__ == "__main__":
+    nome_arquivo = "grid_example.txt"
+    num_linhas, num_colunas, grid = ler_grid_do_arquivo(nome_arquivo)
+    livres = [(r, c) for r in range(num_linhas) for c in range(num_colunas) if grid[r][c] != '#']
+    pares = [(random.choice(livres), random.choice(livres)) for _ in range(200)]
+
+    resultados, qps = resolver_lote(num_linhas, num_colunas, grid, pares)
+    alcancaveis = sum(1 for custo, _ in resultados if custo != math.inf)
+    print(f"{len(pares)} consultas ({alcancaveis} com caminho) a {qps:.1f} consultas/s")
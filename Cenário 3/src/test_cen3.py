@@ -0,0 +1,45 @@
+import math
+import mmap
+
+import pytest
+
+import cen3
+
+GRID = ["S.~.#...",
+        "#.#.#.#.",
+        "..~...#G"]
+
+
+@pytest.mark.parametrize('cabecalho', [b'3\n', b'3 x\n', b'3 3 3\n', b'S..'])
+def test_cabecalho_invalido_fecha_o_mapeamento(tmp_path, monkeypatch, cabecalho):
+    abertos = []
+
+    class MapeamentoRegistrado(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            mapeamento = super().__new__(cls, *args, **kwargs)
+            abertos.append(mapeamento)
+            return mapeamento
+
+    monkeypatch.setattr(cen3.mmap, 'mmap', MapeamentoRegistrado)
+    arquivo = tmp_path / 'grid.txt'
+    arquivo.write_bytes(cabecalho + b'S..\n###\n~G.\n')
+
+    with pytest.raises(ValueError, match="cabeçalho"):
+        cen3.abrir_grid_mapeado(str(arquivo))
+    assert abertos and all(mapeamento.closed for mapeamento in abertos)
+
+
+@pytest.mark.parametrize('classe', [cen3.Dijkstra, cen3.AStar, cen3.DijkstraBidirecional])
+def test_vetores_densos_por_padrao_e_esparsos_sob_demanda(classe):
+    num_linhas, num_colunas = len(GRID), len(GRID[0])
+    converter = cen3.GridToGraphConverter(num_linhas, num_colunas, [list(linha) for linha in GRID])
+
+    denso = classe(converter)
+    d, anterior = denso.executa()
+    assert isinstance(d, list) and len(d) == len(anterior) == num_linhas * num_colunas + 1
+
+    esparso = classe(converter, esparso=True)
+    d_esparso, _ = esparso.executa()
+    assert len(d_esparso) < len(d)
+    assert d_esparso[esparso.destino] == d[denso.destino] != math.inf
+    assert esparso.reconstruir_caminho(converter) == denso.reconstruir_caminho(converter)
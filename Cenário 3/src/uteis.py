@@ -1,3 +1,5 @@
+import math
+from array import array
 from typing import Generator
 from abc import ABC, abstractmethod
 
@@ -160,4 +162,220 @@ def isNeighbor(self, v, w):
           yield w
 
       w += 1
-'''
\ No newline at end of file
+'''
+
+
+class GraphCSR(GraphBase):
+  """
+  Graph stored in compressed sparse row (CSR) form.
+
+  The out-neighbors of vertex v are targets[offsets[v]:offsets[v+1]], with the
+  matching costs in weights, so neighbor iteration is O(deg(v)) and memory is
+  O(n + m). Rows exist for vertices 0..n, so both the 1-based convention of V()
+  and 0-based vertex ids fit. Undirected edges are stored in both directions.
+
+  The structure is meant to be built in bulk (fromArrays, fromAdjMatrix);
+  addEdge and removeEdge rebuild the arrays in O(n + m).
+
+  Attributes
+  ----------
+  offsets : array
+      Start of each vertex row in targets/weights (length n + 2).
+  targets : array
+      Head vertex of every stored arc.
+  weights : array
+      Cost of every stored arc ('q' if all costs are integers, 'd' otherwise).
+  """
+
+  def __init__(self, n: int, directed: bool = False, edges = ()) -> None:
+    ''' Builds the graph from an iterable of (v, w) or (v, w, weight) tuples. '''
+    super().__init__(n, directed)
+    sources, targets, weights = [], [], []
+    for edge in edges:
+      sources.append(edge[0])
+      targets.append(edge[1])
+      weights.append(edge[2] if len(edge) > 2 else 1)
+    self._build(sources, targets, weights)
+
+  @classmethod
+  def fromArrays(cls, n: int, sources, targets, weights = None, directed: bool = False) -> "GraphCSR":
+    ''' Builds the graph from parallel arrays (lists, array.array or NumPy)
+
+    Parameters
+    ----------
+    sources, targets : sequence of int
+      edge i goes from sources[i] to targets[i].
+    weights : sequence of numbers, optional
+      cost of each edge (1 if omitted).
+    '''
+    graph = cls.__new__(cls)
+    GraphBase.__init__(graph, n, directed)
+    sources, targets = _asList(sources), _asList(targets)
+    weights = [1] * len(sources) if weights is None else _asList(weights)
+    graph._build(sources, targets, weights)
+    return graph
+
+  @classmethod
+  def fromAdjMatrix(cls, graph: "GraphAdjMatrix", weighted: bool = False) -> "GraphCSR":
+    ''' Converts a GraphAdjMatrix (or subclass) to CSR
+
+    Parameters
+    ----------
+    graph : GraphAdjMatrix
+      source graph.
+    weighted : bool
+      True if the matrix cells hold edge costs (e.g. a weighted subclass;
+      None, 0 or infinity mean "no edge"), False for the plain matrix where
+      M[v][w] == w marks edge vw (every edge gets cost 1).
+    '''
+    sources, targets, weights = [], [], []
+    for v, row in enumerate(graph.M):
+      for w, value in enumerate(row):
+        if weighted:
+          if value is None or value == 0 or value == math.inf:
+            continue
+        elif value == 0 or value != w: # 0 is the empty cell of this matrix
+          continue
+        if not graph.directed and w < v:
+          continue
+        sources.append(v)
+        targets.append(w)
+        weights.append(value if weighted else 1)
+    return cls.fromArrays(graph.n, sources, targets, weights, graph.directed)
+
+  def toAdjMatrix(self, graphClass = None, weighted: bool = False) -> "GraphAdjMatrix":
+    ''' Converts back to an adjacency matrix graph
+
+    Parameters
+    ----------
+    graphClass : type, optional
+      GraphAdjMatrix or a subclass (default GraphAdjMatrix).
+    weighted : bool
+      True to call graphClass.addEdge(v, w, weight), for weighted subclasses.
+    '''
+    graph = (graphClass or GraphAdjMatrix)(self.n, self.directed)
+    for v, w, weight in self.edgesWithWeights():
+      if weighted:
+        graph.addEdge(v, w, weight)
+      else:
+        graph.addEdge(v, w)
+    return graph
+
+  def _build(self, sources, targets, weights):
+    rows = self.n + 1
+    arcs = 0
+    count = array('q', bytes(8 * (rows + 1)))
+    for v, w in zip(sources, targets):
+      count[v + 1] += 1
+      arcs += 1
+      if not self.directed and v != w:
+        count[w + 1] += 1
+        arcs += 1
+    for v in range(rows):
+      count[v + 1] += count[v]
+
+    code = 'q' if all(isinstance(c, int) for c in weights) else 'd'
+    self.offsets = count
+    self.targets = array('q', bytes(8 * arcs))
+    self.weights = array(code, bytes(8 * arcs))
+    position = array('q', count[:rows])
+    for v, w, c in zip(sources, targets, weights):
+      p = position[v]
+      self.targets[p], self.weights[p] = w, c
+      position[v] = p + 1
+      if not self.directed and v != w:
+        p = position[w]
+        self.targets[p], self.weights[p] = v, c
+        position[w] = p + 1
+    self.m = len(sources)
+    self._reverse = None
+
+  def _inNeighbors(self, v: int):
+    if self._reverse is None:
+      sources = array('q')
+      for u in range(self.n + 1):
+        sources.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+      self._reverse = GraphCSR.fromArrays(self.n, self.targets, sources, self.weights, directed = True)
+    return self._reverse.getNeighbors(v, mode = "+")
+
+  def getNeighbors(self, v: int, mode: str = "*", closed: bool = False) -> Generator[int, None, None]:
+    ''' Provides the neighbors of vertex v in O(deg(v))
+
+    Parameters
+    ----------
+    v : int
+      vertex.
+    mode : str
+      Only for directed graph. "-" if input neighborhood, "+" if output neighborhood and "*" if any.
+    closed : bool
+      True if the neighborhood should include v.
+    '''
+    if closed:
+      yield v
+    if self.directed and mode == "-":
+      yield from self._inNeighbors(v)
+    elif self.directed and mode == "*":
+      seen = set()
+      for w in self.targets[self.offsets[v]:self.offsets[v + 1]]:
+        seen.add(w)
+        yield w
+      for w in self._inNeighbors(v):
+        if w not in seen:
+          yield w
+    else:
+      yield from self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+  def getWeightedNeighbors(self, v: int) -> Generator[tuple[int, float], None, None]:
+    ''' Provides (w, weight) for every out-neighbor w of v in O(deg(v)) '''
+    start, end = self.offsets[v], self.offsets[v + 1]
+    yield from zip(self.targets[start:end], self.weights[start:end])
+
+  def isNeighbor(self, v: int, w: int) -> bool:
+    return w in self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+  def E(self, iterateOverNode = False) -> Generator[tuple[int,int], None, None]:
+    """
+    Retorna a lista de arestas vw
+    """
+    for v, w, _ in self.edgesWithWeights():
+      yield (v, w)
+
+  def edgesWithWeights(self) -> Generator[tuple[int, int, float], None, None]:
+    ''' Every edge once as (v, w, weight); undirected edges with v <= w '''
+    for v in range(self.n + 1):
+      for p in range(self.offsets[v], self.offsets[v + 1]):
+        w = self.targets[p]
+        if self.directed or v <= w:
+          yield (v, w, self.weights[p])
+
+  def addEdge(self, v: int, w: int, weight = 1):
+    ''' Adds edge vw (rebuilds the arrays, O(n + m)) '''
+    sources, targets, weights = self._edgeLists()
+    sources.append(v)
+    targets.append(w)
+    weights.append(weight)
+    self._build(sources, targets, weights)
+
+  def removeEdge(self, v: int, w: int):
+    ''' Removes edge vw (rebuilds the arrays, O(n + m)) '''
+    sources, targets, weights = [], [], []
+    for a, b, c in self.edgesWithWeights():
+      if (a, b) == (v, w) or (not self.directed and (a, b) == (w, v)):
+        continue
+      sources.append(a)
+      targets.append(b)
+      weights.append(c)
+    self._build(sources, targets, weights)
+
+  def _edgeLists(self):
+    sources, targets, weights = [], [], []
+    for v, w, c in self.edgesWithWeights():
+      sources.append(v)
+      targets.append(w)
+      weights.append(c)
+    return sources, targets, weights
+
+
+def _asList(values):
+  ''' Plain Python values from a list, array.array or NumPy array '''
+  return values.tolist() if hasattr(values, 'tolist') else list(values)